@@ -1,31 +1,22 @@
 import streamlit as st
 import pandas as pd
+import tempfile
 from datetime import datetime, timedelta
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import plotly.express as px
-
-# ==========================================
-# 🛠️ 사장님 전용 설정
-# ==========================================
-SHEET_ID = "1hbrT_QQWwCrxsG0Jg81xAJH9_gLzc2ORtmava8tqqUw"
-URL_AUCTION = f"https://docs.google.com/spreadsheets/d/{SHEET_ID}/export?format=csv&gid=0"
-URL_MEMBERS = f"https://docs.google.com/spreadsheets/d/{SHEET_ID}/export?format=csv&gid=773051258" 
-
-SELL_FEE_RATE = 0.14
-DEFAULT_BUY_FEE_RATE = 0.05
-APP_PASSWORD = "4989" 
-# ==========================================
 
-st.set_page_config(page_title="골동품사나이들 관리자", layout="wide")
+from config import SELL_FEE_RATE, DEFAULT_BUY_FEE_RATE, APP_PASSWORD, ADMIN_PASSWORD, SNAPSHOT_DIR, PROFILING, PROFILE_LOG, SETTLED_DB, URL_AUCTION, LIVE_POLL_SECONDS, LEDGER_UI_MAX_LOTS
+from settlement import settle, settle_one
+from parsing import as_dates
+from formatting import get_ko_date, ko_dates
+from tables import paged_table
+from charts import hourly_figure, daily_sales_figure, share_pie, monthly_trend_figure
+from warm import Warmer
+from payments import load_settled, mark_settled
+from search import price_stats
+from export import FORMATS as LEDGER_FORMATS, available_formats, export_ledger, export_busy
+from live import LiveFeed, live_auction_date
+from profiling import span, section, cached_span, cache_miss, note, start_run, finish_run, recent_runs, cache_stats
 
-# --- 한글 요일 변환용 함수 ---
-def get_ko_date(dt):
-    if pd.isna(dt): return ""
-    days_ko = ['월', '화', '수', '목', '금', '토', '일']
-    if isinstance(dt, datetime) or hasattr(dt, 'weekday'):
-        return f"{dt.strftime('%Y-%m-%d')} ({days_ko[dt.weekday()]})"
-    return str(dt)
+st.set_page_config(page_title="골동품사나이들 관리자", layout="wide")
 
 # --- 스타일 설정 ---
 st.markdown("""
@@ -45,46 +36,158 @@ st.markdown("""
     .bank-box { background-color: #fffde7; padding: 15px; border: 2px dashed #fbc02d; border-radius: 10px; margin: 15px 0; font-size: 1.25em; color: #f57f17 !important; font-weight: bold; text-align: center; }
     @media print {
         [data-testid="stSidebar"], [data-testid="stHeader"], .stButton, button, header { display: none !important; }
+        [class*="st-key-page_"] { display: none !important; }
         .main .block-container { max-width: 100% !important; padding: 0 !important; margin: 0 !important; }
     }
     </style>
     """, unsafe_allow_html=True)
 
-@st.cache_data(ttl=600)
-def load_data():
-    try:
-        df_a = pd.read_csv(URL_AUCTION)
-        df_a.columns = ['경매일자', '판매자', '품목', '가격', '구매자', '낙찰시간']
-        
-        # [수정] 가격 데이터 정제 강화 (마이너스 기호 안전하게 처리)
-        def clean_price(val):
-            try:
-                # 쉼표 제거 및 공백 제거
-                s = str(val).replace(',', '').strip()
-                if not s or s == 'nan': return 0
-                # 실수형으로 변환 후 정수형으로 변환 (마이너스 유지)
-                return int(float(s))
-            except:
-                return 0
-        
-        df_a['가격'] = df_a['가격'].apply(clean_price)
-        df_a['경매일자_dt'] = pd.to_datetime(df_a['경매일자'], errors='coerce')
-        df_a = df_a.dropna(subset=['경매일자_dt']) 
-        df_a['경매일자'] = df_a['경매일자_dt'].dt.date
-        
-        df_m = pd.read_csv(URL_MEMBERS)
-        # I열(9번째) 계좌번호 포함 로드
-        member_cols = ['닉네임', '이름', '전화번호', '주소', '수수료면제여부', '전미수', '금액', '마지막혜택일', '계좌번호']
-        if len(df_m.columns) >= 9:
-            df_m = df_m.iloc[:, :9]; df_m.columns = member_cols
-        else:
-            df_m.columns = member_cols[:len(df_m.columns)]
-            if '계좌번호' not in df_m.columns: df_m['계좌번호'] = "정보없음"
-        df_m['마지막혜택일'] = pd.to_datetime(df_m['마지막혜택일'], errors='coerce').dt.date
-        return df_a, df_m
-    except Exception as e:
-        st.error(f"데이터 로드 중 오류 발생: {e}"); return None, None
-
+# --- 데이터와 화면용 색인/집계는 서버와 함께 시작하는 백그라운드 작업이 미리 준비 (프로세스 전체 공유) ---
+# 스냅샷 만료 전에 새로 받아 다음 버전을 다 만든 뒤 한 번에 교체하므로 화면은 준비된 묶음만 읽음
+# (모든 세션이 같은 DataFrame을 공유하므로 화면 코드에서 절대 수정하지 않음)
+@st.cache_resource
+def get_warmer():
+    return Warmer(SNAPSHOT_DIR).start()
+
+# --- 펼친 탭/접힌 영역 내용 (열었을 때만 만들고 데이터 버전별로 보관) ---
+@st.cache_resource(max_entries=32)
+def member_history(data_version, nick, role, _df, _nick_index):
+    cache_miss('member_history')
+    other = '판매자' if role == '구매자' else '구매자'
+    disp = _df.iloc[_nick_index.rows(role, nick)][['경매일자', '품목', '가격', other]]
+    disp = disp.sort_values('경매일자', ascending=False, kind='stable').reset_index(drop=True)
+    disp.index += 1
+    return disp
+
+
+# --- 차트 (화면·기간·데이터 버전별로 만든 Figure 를 보관 → 다시 그릴 때는 직렬화만) ---
+@st.cache_resource(max_entries=64)
+def cached_figure(name, period, data_version, _build):
+    cache_miss('figure')
+    return _build()
+
+def plot(name, period, data_version, build):
+    with cached_span('figure', chart=name): fig = cached_figure(name, period, data_version, build)
+    with span(f"chart:{name}"): st.plotly_chart(fig, use_container_width=True)
+
+# --- 입금/정산 체크 목록 (체크하면 이 부분만 다시 실행, 완료 표시는 SQLite에 저장) ---
+def toggle_settled(day, kind, nick, key):
+    mark_settled(SETTLED_DB, day, kind, nick, st.session_state[key])
+
+@st.fragment
+def payment_lists(day, pay_in, pay_out):
+    done = load_settled(SETTLED_DB, day)
+    col_in, col_out = st.columns(2)
+    for col, kind, items, title, rem_label in ((col_in, 'in', pay_in, "📩 입금 받을 돈 (구매자)", "남은 미입금 합계"),
+                                               (col_out, 'out', pay_out, "💵 정산 드릴 돈 (판매자)", "남은 미정산 합계")):
+        with col:
+            st.subheader(title)
+            rem = st.empty(); t_rem = 0
+            for item in sorted(items, key=lambda x: x['금액'], reverse=True):
+                key = f"{kind}_{day}_{item['고객명']}"
+                st.session_state[key] = done.get((kind, item['고객명']), False)  # 다른 세션/기기에서 바꾼 표시 반영
+                c_chk, c_name, c_amt = st.columns([1, 4, 4])
+                is_c = c_chk.checkbox("", key=key, on_change=toggle_settled, args=(day, kind, item['고객명'], key))
+                c_name.markdown(f"**{item['고객명']}**")
+                c_amt.markdown(f"{item['금액']:,.0f}원")
+                if not is_c: t_rem += item['금액']
+            rem.markdown(f"<div class='total-highlight'>{rem_label}: {t_rem:,.0f}원</div>", unsafe_allow_html=True)
+
+# --- 회계 장부 내려받기 (누르면 별도 스레드에서 조각 단위로 만들어 임시 파일에 씀 → 화면 실행을 막지 않음) ---
+# 만든 파일은 스트림릿이 통째로 읽어 세션이 끝날 때까지 메모리에 두므로 LEDGER_UI_MAX_LOTS 건이 넘는 기간은 명령줄 안내
+@st.fragment
+def ledger_download(df, members, date_index, name, start, end):
+    lo, hi = date_index.bounds(start, end)
+    if hi - lo > LEDGER_UI_MAX_LOTS:
+        st.info(f"경매 {hi - lo:,}건은 화면에서 내려받기에 너무 많습니다 (최대 {LEDGER_UI_MAX_LOTS:,}건). "
+                f"서버에서 `python export.py --start {start:%Y-%m-%d} --end {end:%Y-%m-%d}` 로 만드세요.")
+        return
+    c_fmt, c_btn = st.columns([1, 4])
+    fmt = c_fmt.selectbox("형식", available_formats(), key=f"ledger_fmt_{name}", label_visibility="collapsed")
+
+    def build():
+        out = tempfile.TemporaryFile()
+        export_ledger(df, members, lo, hi, out, fmt, wait=False)
+        out.seek(0)
+        return out
+
+    busy = export_busy()
+    c_btn.download_button(f"📥 {name} 회계 장부 내려받기 (고객·경매일자별 수수료/정산, 경매 {hi - lo:,}건)", data=build, disabled=busy,
+                          file_name=f"장부_{name}.{fmt}", mime=LEDGER_FORMATS[fmt], on_click="ignore", key=f"ledger_{name}_{fmt}")
+    if busy:
+        c_btn.caption("다른 장부 내보내기가 진행 중입니다. 잠시 후 다시 시도하세요.")
+
+# --- 일별 요약 본문 (저장된 데이터의 하루 집계 또는 실시간 경매 집계) ---
+def day_summary(day_view, day, chart_version, day_settle):
+    st.subheader("📈 시간대별 매출 및 낙찰 건수 (오후 2시 ~ 새벽 2시)")
+    fixed_hours = list(range(14, 27))
+    time_agg = day_view.hourly().reset_index()
+    full_range = pd.DataFrame({'정렬시간': fixed_hours})
+    time_agg = pd.merge(full_range, time_agg, on='정렬시간', how='left').fillna(0)
+
+    def make_label(h):
+        h = int(h); act_h = h if h < 24 else h - 24
+        p = "오후" if 12 <= act_h < 24 else "오전"
+        pretty = act_h if act_h <= 12 else act_h - 12
+        if pretty == 0: pretty = 12
+        return f"{p} {pretty}시"
+    time_agg['시간대'] = time_agg['정렬시간'].apply(make_label)
+
+    plot("hourly", day, chart_version, lambda: hourly_figure(time_agg))
+    
+    hours_exp = st.expander("🕒 시간대별 상세 실적표 보기", key="hours_detail", on_change="rerun")
+    if hours_exp.open:
+        with hours_exp: paged_table(time_agg[['시간대', '매출금액', '낙찰건수']].set_index('시간대'), "hours", {'매출금액': '원', '낙찰건수': '건'})
+
+    st.write("---")
+    total_sales = day_view.total_sales
+    sell_fees = int(total_sales * SELL_FEE_RATE)
+    total_buy_fees = int(day_settle['구매수수료'].sum())
+    bal = day_settle['정산금액']
+    pay_out = [{"고객명": p, "금액": int(v)} for p, v in bal[bal > 0].items()]
+    pay_in = [{"고객명": p, "금액": int(-v)} for p, v in bal[bal < 0].items()]
+
+    c1, c2, c3 = st.columns(3)
+    with c1: st.markdown(f"<div class='summary-box'><h3>💰 총 매출</h3><h2>{total_sales:,.0f}원</h2></div>", unsafe_allow_html=True)
+    with c2: st.markdown(f"<div class='summary-box'><h3>📉 예상 수익(수수료)</h3><h2>{sell_fees + total_buy_fees:,.0f}원</h2></div>", unsafe_allow_html=True)
+    with c3: st.markdown(f"<div class='summary-box'><h3>📦 낙찰 건수</h3><h2>{day_view.count}건</h2></div>", unsafe_allow_html=True)
+    
+    st.write("---")
+    r_col1, r_col2 = st.columns(2)
+    with r_col1:
+        st.subheader("🏆 오늘자 구매 TOP 10")
+        rb = day_view.buyers().head(10).reset_index()
+        rb.index += 1; rb.columns = ['고객명', '구매금액']; paged_table(rb, "day_buyers", {'구매금액': '원'})
+    with r_col2:
+        st.subheader("💰 오늘자 판매 TOP 10")
+        rs = day_view.sellers().head(10).reset_index()
+        rs.index += 1; rs.columns = ['고객명', '판매금액']; paged_table(rs, "day_sellers", {'판매금액': '원'})
+
+    st.subheader("🔝 오늘자 최고가 낙찰품 TOP 10")
+    rt = day_view.top_lots(10)[['품목', '가격', '구매자', '판매자']].reset_index(drop=True)
+    rt.index += 1; paged_table(rt, "day_lots", {'가격': '원'})
+
+    st.write("---")
+    section("view:일별 요약:입금/정산 목록", customers=len(bal))
+    payment_lists(str(day), pay_in, pay_out)
+
+# --- 실시간 경매 모드 (프로세스 전체가 같은 집계를 공유, 열려 있는 화면은 이 부분만 주기적으로 다시 그림) ---
+@st.cache_resource
+def get_live_feed():
+    return LiveFeed(URL_AUCTION)
+
+@st.fragment(run_every=LIVE_POLL_SECONDS)
+def live_summary(members):
+    feed = get_live_feed()
+    day = live_auction_date()
+    with span('live_poll'): feed.poll(day, LIVE_POLL_SECONDS)
+    checked = datetime.fromtimestamp(feed.polled_at).strftime('%H:%M:%S') if feed.polled_at else "-"
+    st.caption(f"🔴 {LIVE_POLL_SECONDS}초마다 자동 갱신 · 마지막 확인 {checked}" + (f" · ⚠️ 확인 실패: {feed.error}" if feed.error else ""))
+    day_view = feed.view()
+    if day_view is None or day_view.empty: st.info("아직 오늘 낙찰 내역이 없습니다."); return
+    day_summary(day_view, day, f"live-{feed.revision}", day_view.settled(members))
+
+warmer = get_warmer()  # 첫 접속(로그인 화면)부터 준비를 시작
 if 'logged_in' not in st.session_state: st.session_state['logged_in'] = False
 
 if not st.session_state['logged_in']:
@@ -93,38 +196,54 @@ if not st.session_state['logged_in']:
         st.markdown("<h1 style='text-align: center;'>🔐 골동품사나이들 보안 접속</h1>", unsafe_allow_html=True)
         input_pw = st.text_input("", type="password", placeholder="Password")
         if st.button("로그인", use_container_width=True):
-            if input_pw == APP_PASSWORD: st.session_state['logged_in'] = True; st.rerun()
+            is_admin = bool(ADMIN_PASSWORD) and input_pw == ADMIN_PASSWORD
+            if input_pw == APP_PASSWORD or is_admin: st.session_state['logged_in'] = True; st.session_state['is_admin'] = is_admin; st.rerun()
             else: st.error("비밀번호 불일치")
 else:
-    df, df_members = load_data()
-    if df is not None:
+    if PROFILING or st.session_state.get('profiling'): start_run(admin=st.session_state.get('is_admin', False))
+    with cached_span('load_data') as rec:
+        if warmer.state is None: cache_miss('load_data')  # 서버 기동 직후 첫 준비가 끝날 때까지만 기다림
+        prepared = warmer.current()  # 이번 실행 동안은 이 묶음만 사용 (중간에 새 버전으로 바뀌어도 섞이지 않음)
+        rec['rows'] = 0 if prepared is None else len(prepared.df)
+    if prepared is None:
+        st.error(f"데이터 로드 중 오류 발생: {warmer.error}")
+    else:
+        df, df_members, members = prepared.df, prepared.df_members, prepared.members
+        cube, nick_index, date_index, item_index, store = prepared.cube, prepared.nick_index, prepared.date_index, prepared.item_index, prepared.store
+        section('sidebar:조회 설정')
+        row_lo, row_hi = 0, len(df)
+        live_mode = False
         if st.sidebar.button("🔄 최신 데이터 불러오기", use_container_width=True):
-            st.cache_data.clear()  # 저장된 데이터를 강제로 삭제
-            st.rerun()             # 화면을 다시 그려서 구글 시트에서 새로 가져옴
+            try:
+                warmer.warm(refresh=True)  # 구글 시트에서 새로 받아 스냅샷 갱신 후 새 묶음으로 교체
+                st.rerun()                 # 화면을 다시 그려서 새 데이터를 읽음
+            except Exception as e:
+                st.sidebar.error(f"새로고침 실패 (기존 데이터 유지): {e}")
         st.sidebar.subheader("🔎 조회 설정")
-        view_mode = st.sidebar.radio("모드 선택", ["일별 조회", "기간별 조회", "일별 요약", "월별 요약", "연간 요약", "👤 회원 정보 조회"])
-        available_dates = sorted(df['경매일자'].unique(), reverse=True)
+        view_mode = st.sidebar.radio("모드 선택", ["일별 조회", "기간별 조회", "일별 요약", "월별 요약", "연간 요약", "👤 회원 정보 조회", "🔍 품목 검색"])
+        note(view=view_mode, data_version=df.attrs.get('data_version'))
+        available_dates = date_index.dates
         
         # ---------------------------------------------------------
         # 1. 회원 정보 조회 모드
         # ---------------------------------------------------------
         if view_mode == "👤 회원 정보 조회":
+            section(f"view:{view_mode}")
             st.title("👤 회원 정보 통합 관리")
             search_nick = st.sidebar.selectbox("찾으실 회원을 선택하세요", sorted(df_members['닉네임'].unique()))
             m_info = df_members[df_members['닉네임'] == search_nick].iloc[0]
             
             # 수수료 포함 계산
-            is_exempt = str(m_info['수수료면제여부']) == '면제'
-            p_buy = df[df['구매자'] == search_nick].copy()
-            p_sell = df[df['판매자'] == search_nick].copy()
-            
-            raw_buy = p_buy['가격'].sum()
-            buy_fee = 0 if is_exempt else int(raw_buy * DEFAULT_BUY_FEE_RATE)
-            total_buy_with_fee = raw_buy + buy_fee 
+            p_buy = df.iloc[nick_index.rows('구매자', search_nick)]
+            p_sell = df.iloc[nick_index.rows('판매자', search_nick)]
+            p_rows = df.iloc[nick_index.member_rows(search_nick)]
+            if store: p_total = store.settle_one(members, search_nick)
+            elif search_nick in prepared.member_totals.index: p_total = prepared.member_totals.loc[search_nick]
+            else: p_total = settle_one(p_rows, members, search_nick)
+            is_exempt = bool(p_total['면제'])
             
-            raw_sell = p_sell['가격'].sum()
-            sell_fee = int(raw_sell * SELL_FEE_RATE)
-            total_sell_net = raw_sell - sell_fee 
+            raw_buy, buy_fee, total_buy_with_fee = p_total['구매합계'], p_total['구매수수료'], p_total['구매청구']
+            raw_sell, sell_fee, total_sell_net = p_total['판매합계'], p_total['판매수수료'], p_total['판매정산']
             
             if raw_buy >= 10000000: grade, g_color = "🔥 전액지원 대상", "#e74c3c"
             elif raw_buy >= 5000000: grade, g_color = "💎 50% 지원 대상", "#3498db"
@@ -175,89 +294,77 @@ else:
 
             st.write("---")
             st.subheader("📊 일별 정산 금액")
-            all_dates = pd.concat([p_buy['경매일자'], p_sell['경매일자']]).dropna().unique()
-            daily_list = []
-
-            for d in sorted(all_dates):
-                day_buy = p_buy[p_buy['경매일자'] == d]['가격'].sum()
-                day_sell = p_sell[p_sell['경매일자'] == d]['가격'].sum()
-
-                buy_fee_day = 0 if is_exempt else int(day_buy * DEFAULT_BUY_FEE_RATE)
-                sell_fee_day = int(day_sell * SELL_FEE_RATE)
-    
-                buy_total = day_buy + buy_fee_day
-                sell_total = day_sell - sell_fee_day
-                balance = sell_total - buy_total
-
-                daily_list.append({
-                    "날짜": get_ko_date(d),
-                    "판매정산": sell_total,
-                    "구매금액": buy_total,
-                    "정산금액": balance
-                })
-                
-            if daily_list:
-                daily_df = pd.DataFrame(daily_list).sort_values("날짜", ascending=False).reset_index(drop=True)
+            p_daily = store.settle(members, nick=search_nick, by_day=True) if store else settle(p_rows, members, by=['경매일자'])
+            p_daily = p_daily.xs(search_nick, level='고객명') if search_nick in p_daily.index.get_level_values('고객명') else p_daily.iloc[0:0]
+
+            if not p_daily.empty:
+                daily_df = pd.DataFrame({
+                    "날짜": p_daily.index.to_numpy(),
+                    "판매정산": p_daily['판매정산'].to_numpy(),
+                    "구매금액": p_daily['구매청구'].to_numpy(),
+                    "정산금액": p_daily['정산금액'].to_numpy()
+                }).sort_values("날짜", ascending=False).reset_index(drop=True)
                 daily_df.index += 1
-
-                daily_df["판매정산"] = daily_df["판매정산"].map('{:,.0f}원'.format)
-                daily_df["구매금액"] = daily_df["구매금액"].map('{:,.0f}원'.format)
-                daily_df["정산금액"] = daily_df["정산금액"].map('{:+,.0f}원'.format)
-
-                st.table(daily_df)
+                paged_table(daily_df, f"daily_{search_nick}", {"날짜": ko_dates, "판매정산": '원', "구매금액": '원', "정산금액": '원'}, signed=["정산금액"])
             else:
                 st.info("거래 내역이 없습니다.")
 
             st.write("---")
             
-            t1, t2 = st.tabs(["🛍️ 전체 구매 내역", "📦 전체 판매 내역"])
-            with t1:
-                if not p_buy.empty:
-                    p_buy_disp = p_buy[['경매일자', '품목', '가격', '판매자']].sort_values('경매일자', ascending=False).reset_index(drop=True)
-                    p_buy_disp.index += 1; p_buy_disp['경매일자'] = p_buy_disp['경매일자'].apply(get_ko_date)
-                    p_buy_disp['가격'] = p_buy_disp['가격'].map('{:,.0f}'.format); st.table(p_buy_disp)
-                else: st.info("구매 내역이 없습니다.")
-            with t2:
-                if not p_sell.empty:
-                    p_sell_disp = p_sell[['경매일자', '품목', '가격', '구매자']].sort_values('경매일자', ascending=False).reset_index(drop=True)
-                    p_sell_disp.index += 1; p_sell_disp['경매일자'] = p_sell_disp['경매일자'].apply(get_ko_date)
-                    p_sell_disp['가격'] = p_sell_disp['가격'].map('{:,.0f}'.format); st.table(p_sell_disp)
-                else: st.info("판매 내역이 없습니다.")
+            # 선택한 탭만 그림 (다른 탭은 눌렀을 때 계산)
+            t1, t2 = st.tabs(["🛍️ 전체 구매 내역", "📦 전체 판매 내역"], key="member_tabs", on_change="rerun")
+            for tab, role, key, empty_msg in ((t1, '구매자', 'buy', "구매 내역이 없습니다."), (t2, '판매자', 'sell', "판매 내역이 없습니다.")):
+                if not tab.open: continue
+                with tab:
+                    with cached_span('member_history', role=role):
+                        hist = member_history(df.attrs.get('data_version'), search_nick, role, df, nick_index)
+                    if not hist.empty: paged_table(hist, f"{key}_{search_nick}", {'경매일자': ko_dates, '가격': ''})
+                    else: st.info(empty_msg)
             selected_person = "MEMBER_DETAIL_VIEW"
 
         # ---------------------------------------------------------
         # [기존] 일별 요약 및 조회
         # ---------------------------------------------------------
         elif view_mode == "일별 요약":
-            selected_date = st.sidebar.selectbox("📅 요약 날짜 선택", available_dates) if available_dates else None
-            filtered_df = df[df['경매일자'] == selected_date] if selected_date else pd.DataFrame()
-            date_title = f"📊 {get_ko_date(selected_date) if selected_date else ''} 판매 요약 보고서"
+            live_mode = st.sidebar.toggle("🔴 실시간 경매 모드", key="live_mode", help="오늘 경매의 새 낙찰만 주기적으로 반영합니다")
+            if live_mode:
+                selected_date = live_auction_date()
+                date_title = f"🔴 {get_ko_date(selected_date)} 실시간 경매 현황"
+            else:
+                selected_date = st.sidebar.selectbox("📅 요약 날짜 선택", available_dates) if available_dates else None
+                date_title = f"📊 {get_ko_date(selected_date) if selected_date else ''} 판매 요약 보고서"
             selected_person = "SUMMARY_MODE"
         elif view_mode == "일별 조회":
             selected_date = st.sidebar.selectbox("📅 날짜 선택", available_dates) if available_dates else None
-            filtered_df = df[df['경매일자'] == selected_date] if selected_date else pd.DataFrame()
+            row_lo, row_hi = date_index.bounds(selected_date) if selected_date else (0, 0)
+            period = (selected_date, selected_date)
+            filtered_df = df.iloc[row_lo:row_hi]
             date_title = f"📅 경매일자: {get_ko_date(selected_date) if selected_date else ''}"
         elif view_mode == "기간별 조회": # 기간별
             c1, c2 = st.sidebar.columns(2)
             start_date = c1.date_input("시작일", datetime.now().date() - timedelta(days=7))
             end_date = c2.date_input("종료일", datetime.now().date())
-            filtered_df = df[(df['경매일자'] >= start_date) & (df['경매일자'] <= end_date)]
+            row_lo, row_hi = date_index.bounds(start_date, end_date)
+            period = (start_date, end_date)
+            filtered_df = df.iloc[row_lo:row_hi]
             date_title = f"🗓️ 기간: {get_ko_date(start_date)} ~ {get_ko_date(end_date)}"
         elif view_mode == "연간 요약":
-            df['연도'] = df['경매일자_dt'].dt.year
-            available_years = sorted(df['연도'].unique(), reverse=True)
-            selected_year = st.sidebar.selectbox("📅 연도 선택", available_years)
-            filtered_df = df[df['연도'] == selected_year]
+            selected_year = st.sidebar.selectbox("📅 연도 선택", cube.years())
             selected_person = "YEARLY_SUMMARY"
         elif view_mode == "월별 요약":
-            df['연월'] = df['경매일자_dt'].dt.strftime('%Y-%m')
-            available_months = sorted(df['연월'].unique(), reverse=True)
-            selected_month = st.sidebar.selectbox("📅 월 선택", available_months)
-            filtered_df = df[df['연월'] == selected_month]
+            selected_month = st.sidebar.selectbox("📅 월 선택", cube.months())
             selected_person = "MONTHLY_SUMMARY"
+        elif view_mode == "🔍 품목 검색":
+            item_query = st.sidebar.text_input("품목 검색어", key="item_query", placeholder="예: 청자 화병")
+            if st.sidebar.checkbox("기간 지정", key="item_period"):
+                c1, c2 = st.sidebar.columns(2)
+                start_date = c1.date_input("시작일", datetime.now().date() - timedelta(days=365), key="item_start")
+                end_date = c2.date_input("종료일", datetime.now().date(), key="item_end")
+                row_lo, row_hi = date_index.bounds(start_date, end_date)
+            selected_person = "ITEM_SEARCH"
 
         # 고객 선택 박스 (월별/연간/회원정보 모드 아닐 때만)
-        if view_mode not in ["월별 요약", "연간 요약", "일별 요약", "👤 회원 정보 조회"]:
+        if view_mode not in ["월별 요약", "연간 요약", "일별 요약", "👤 회원 정보 조회", "🔍 품목 검색"]:
             participants = sorted([p for p in pd.concat([filtered_df['판매자'], filtered_df['구매자']]).dropna().unique() if str(p).strip() != ""])
             selected_person = st.sidebar.selectbox(f"👤 고객 선택 ({len(participants)}명)", ["선택하세요"] + participants)
 
@@ -269,40 +376,13 @@ else:
         st.sidebar.write("---")
         st.sidebar.subheader("💎 배송비 이벤트 명단")
         
-        def get_event_status(nickname):
-            row = df_members[df_members['닉네임'] == nickname]
-            if row.empty: return 0, 0
-            
-            last_benefit = row.iloc[0]['마지막혜택일']
-            user_data = df[df['구매자'] == nickname]
-            
-            # 마지막 혜택일 이후 데이터만 필터링
-            if not pd.isna(last_benefit): 
-                user_data = user_data[user_data['경매일자_dt'].dt.date > last_benefit]
-            
-            total_sum = user_data['가격'].sum()
-            
-            # [중요 수정] 합계가 마이너스(반품 초과)일 경우 0으로 처리 (오류 방지)
-            if total_sum <= 0:
-                return 0, 0
-
-            # 💡 1000만원마다 리셋 로직
-            current_amt = total_sum % 10000000 
-            cycle_count = total_sum // 10000000
-            
-            return current_amt, cycle_count
-        
-        all_buyers = df['구매자'].dropna().unique()
-        vvip_results = []
-        
-        for b in all_buyers:
-            amt, cycle = get_event_status(b)
-            # 300만원 이상일 때만 표시
-            if amt >= 3000000: 
-                vvip_results.append({'nick': b, 'amt': amt, 'cycle': cycle})
+        # 마지막 혜택일 이후 누적 구매액 (1000만원 리셋, 마이너스 합계는 0 처리) - 300만원 이상만 표시
+        section('sidebar:배송비 이벤트 명단')
+        with span('event_ledger') as rec:
+            vvip_results = prepared.standings
+            rec['rows'] = len(vvip_results)
         
         if vvip_results:
-            vvip_results = sorted(vvip_results, key=lambda x: x['amt'], reverse=True)
             for v in vvip_results:
                 # 등급 및 색상 결정
                 if v['amt'] >= 9000000:
@@ -326,142 +406,36 @@ else:
 
         # --- 메인 화면 로직 ---
         if view_mode != "👤 회원 정보 조회":
+            section(f"view:{view_mode}")
             if selected_person == "SUMMARY_MODE":
                 st.title(date_title)
-                if not filtered_df.empty:
-                    st.subheader("📈 시간대별 매출 및 낙찰 건수 (오후 2시 ~ 새벽 2시)")
-                    def parse_auction_time(time_val):
-                        try:
-                            t_str = str(time_val).strip()
-                            if not t_str or t_str == 'nan': return None
-                            t_str = t_str.replace("오후", "PM").replace("오전", "AM")
-                            for fmt in ("%p %I:%M:%S", "%p %I:%M", "%H:%M:%S", "%H:%M"):
-                                try:
-                                    dt_obj = datetime.strptime(t_str, fmt)
-                                    h = dt_obj.hour
-                                    return h if h >= 14 else h + 24
-                                except: continue
-                            return None
-                        except: return None
-
-                    chart_df = filtered_df.copy()
-                    chart_df['정렬시간'] = chart_df['낙찰시간'].apply(parse_auction_time)
-                    fixed_hours = list(range(14, 27))
-                    time_agg = chart_df.groupby('정렬시간').agg(매출금액=('가격', 'sum'), 낙찰건수=('가격', 'count')).reset_index()
-                    full_range = pd.DataFrame({'정렬시간': fixed_hours})
-                    time_agg = pd.merge(full_range, time_agg, on='정렬시간', how='left').fillna(0)
-
-                    def make_label(h):
-                        h = int(h); act_h = h if h < 24 else h - 24
-                        p = "오후" if 12 <= act_h < 24 else "오전"
-                        pretty = act_h if act_h <= 12 else act_h - 12
-                        if pretty == 0: pretty = 12
-                        return f"{p} {pretty}시"
-                    time_agg['시간대'] = time_agg['정렬시간'].apply(make_label)
-
-                    fig = make_subplots(specs=[[{"secondary_y": True}]])
-                    fig.add_trace(go.Bar(
-                        x=time_agg['시간대'], y=time_agg['매출금액'], name="매출액", 
-                        marker_color='#3498db', opacity=0.7,
-                        hovertemplate="%{x}<br>매출액: %{y:,.0f}원<extra></extra>"
-                    ), secondary_y=False)
-                    fig.add_trace(go.Scatter(
-                        x=time_agg['시간대'], y=time_agg['낙찰건수'], name="낙찰건수", mode='lines+markers+text', 
-                        line=dict(color='#e74c3c', width=3), text=time_agg['낙찰건수'].apply(lambda x: f"{int(x)}건" if x>0 else ""), 
-                        textposition="top center", hovertemplate="%{x}<br>낙찰건수: %{y}건<extra></extra>"
-                    ), secondary_y=True)
-                    fig.update_layout(hovermode="x unified", legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1), height=450)
-                    st.plotly_chart(fig, use_container_width=True)
-                    
-                    with st.expander("🕒 시간대별 상세 실적표 보기"):
-                        display_t = time_agg[['시간대', '매출금액', '낙찰건수']].copy()
-                        display_t['매출금액'] = display_t['매출금액'].map('{:,.0f}원'.format)
-                        display_t['낙찰건수'] = display_t['낙찰건수'].map('{:,.0f}건'.format)
-                        st.table(display_t.set_index('시간대'))
-
-                    st.write("---")
-                    total_sales = filtered_df['가격'].sum()
-                    sell_fees = int(total_sales * SELL_FEE_RATE)
-                    all_p = sorted(list(set(filtered_df['판매자'].unique()) | set(filtered_df['구매자'].unique())))
-                    pay_in, pay_out, total_buy_fees = [], [], 0
-                    for p in all_p:
-                        s_amt = int(filtered_df[filtered_df['판매자'] == p]['가격'].sum())
-                        s_net = s_amt - int(s_amt * SELL_FEE_RATE)
-                        is_ex = not df_members[df_members['닉네임'] == p].empty and str(df_members[df_members['닉네임'] == p].iloc[0]['수수료면제여부']).strip() == "면제"
-                        b_raw = int(filtered_df[filtered_df['구매자'] == p]['가격'].sum())
-                        b_f = 0 if is_ex else int(b_raw * DEFAULT_BUY_FEE_RATE)
-                        total_buy_fees += b_f; bal = s_net - (b_raw + b_f)
-                        if bal > 0: pay_out.append({"고객명": p, "금액": bal})
-                        elif bal < 0: pay_in.append({"고객명": p, "금액": abs(bal)})
-
-                    c1, c2, c3 = st.columns(3)
-                    with c1: st.markdown(f"<div class='summary-box'><h3>💰 총 매출</h3><h2>{total_sales:,.0f}원</h2></div>", unsafe_allow_html=True)
-                    with c2: st.markdown(f"<div class='summary-box'><h3>📉 예상 수익(수수료)</h3><h2>{sell_fees + total_buy_fees:,.0f}원</h2></div>", unsafe_allow_html=True)
-                    with c3: st.markdown(f"<div class='summary-box'><h3>📦 낙찰 건수</h3><h2>{len(filtered_df)}건</h2></div>", unsafe_allow_html=True)
-                    
-                    st.write("---")
-                    r_col1, r_col2 = st.columns(2)
-                    with r_col1:
-                        st.subheader("🏆 오늘자 구매 TOP 10")
-                        rb = filtered_df.groupby('구매자')['가격'].sum().sort_values(ascending=False).head(10).reset_index()
-                        rb.index += 1; rb.columns = ['고객명', '구매금액']; rb['구매금액'] = rb['구매금액'].map('{:,.0f}원'.format); st.table(rb)
-                    with r_col2:
-                        st.subheader("💰 오늘자 판매 TOP 10")
-                        rs = filtered_df.groupby('판매자')['가격'].sum().sort_values(ascending=False).head(10).reset_index()
-                        rs.index += 1; rs.columns = ['고객명', '판매금액']; rs['판매금액'] = rs['판매금액'].map('{:,.0f}원'.format); st.table(rs)
-
-                    st.subheader("🔝 오늘자 최고가 낙찰품 TOP 10")
-                    rt = filtered_df.sort_values(by='가격', ascending=False).head(10)[['품목', '가격', '구매자', '판매자']].reset_index(drop=True)
-                    rt.index += 1; rt['가격'] = rt['가격'].map('{:,.0f}원'.format); st.table(rt)
-
-                    st.write("---")
-                    col_in, col_out = st.columns(2)
-                    with col_in:
-                        st.subheader("📩 입금 받을 돈 (구매자)")
-                        in_rem = st.empty(); t_in = 0
-                        for item in sorted(pay_in, key=lambda x: x['금액'], reverse=True):
-                            c_chk, c_name, c_amt = st.columns([1, 4, 4])
-                            is_c = c_chk.checkbox("", key=f"in_{selected_date}_{item['고객명']}")
-                            c_name.markdown(f"**{item['고객명']}**")
-                            c_amt.markdown(f"{item['금액']:,.0f}원")
-                            if not is_c: t_in += item['금액']
-                        in_rem.markdown(f"<div class='total-highlight'>남은 미입금 합계: {t_in:,.0f}원</div>", unsafe_allow_html=True)
-                    with col_out:
-                        st.subheader("💵 정산 드릴 돈 (판매자)")
-                        out_rem = st.empty(); t_out = 0
-                        for item in sorted(pay_out, key=lambda x: x['금액'], reverse=True):
-                            c_chk, c_name, c_amt = st.columns([1, 4, 4])
-                            is_c = c_chk.checkbox("", key=f"out_{selected_date}_{item['고객명']}")
-                            c_name.markdown(f"**{item['고객명']}**")
-                            c_amt.markdown(f"{item['금액']:,.0f}원")
-                            if not is_c: t_out += item['금액']
-                        out_rem.markdown(f"<div class='total-highlight'>남은 미정산 합계: {t_out:,.0f}원</div>", unsafe_allow_html=True)
+                day_view = cube.day(selected_date) if selected_date and not live_mode else None
+                if live_mode:
+                    live_summary(members)
+                elif day_view is not None and not day_view.empty:
+                    day_summary(day_view, selected_date, df.attrs.get('data_version'),
+                                store.settle(members, selected_date, selected_date) if store else day_view.settled(members))
                 else: st.info("데이터가 없습니다.")
 
             elif selected_person == "MONTHLY_SUMMARY":
                 st.title(f"📅 {selected_month} 월간 실적 요약")
-                if not filtered_df.empty:
+                month_view = cube.month(selected_month)
+                if not month_view.empty:
                     # --- [수정된 부분] 월별 요약 상단 카드 (3칸 + 2칸) ---
-                    total_sales = filtered_df['가격'].sum()
+                    total_sales = month_view.total_sales
                     
-                    # 수수료 수익 계산
+                    # 수수료 수익 계산 (구매 수수료는 회원별 월 합계 기준, 면제 회원 제외)
                     sell_fees_m = int(total_sales * SELL_FEE_RATE)
-                    buy_fees_m = 0
-                    m_buyers = filtered_df['구매자'].unique()
-                    for b in m_buyers:
-                        b_amt = filtered_df[filtered_df['구매자'] == b]['가격'].sum()
-                        row = df_members[df_members['닉네임'] == b]
-                        is_ex = not row.empty and str(row.iloc[0]['수수료면제여부']) == '면제'
-                        if not is_ex: buy_fees_m += int(b_amt * DEFAULT_BUY_FEE_RATE)
+                    month_settle = store.settle(members, month_view.daily.index.min(), month_view.daily.index.max()) if store else month_view.settled(members)
+                    buy_fees_m = int(month_settle['구매수수료'].sum())
                     total_revenue = sell_fees_m + buy_fees_m
 
                     # 각종 일평균 계산
-                    unique_days = filtered_df['경매일자'].nunique()
+                    unique_days = month_view.n_days
                     avg_sales = total_sales / unique_days if unique_days > 0 else 0
-                    avg_counts = len(filtered_df) / unique_days if unique_days > 0 else 0
+                    avg_counts = month_view.count / unique_days if unique_days > 0 else 0
                     # 일평균 참여자(구매자+판매자)
-                    daily_cust = filtered_df.groupby('경매일자').apply(lambda x: len(set(x['구매자']) | set(x['판매자'])))
-                    avg_cust = daily_cust.mean() if not daily_cust.empty else 0
+                    avg_cust = month_view.daily['참여자'].mean() if unique_days > 0 else 0
 
                     # 1행: 매출 / 수익 / 평균매출 (3칸)
                     c1, c2, c3 = st.columns(3)
@@ -471,65 +445,54 @@ else:
                     
                     # 2행: 낙찰건수 / 참여고객수 (2칸)
                     c4, c5 = st.columns(2)
-                    with c4: st.markdown(f"<div class='summary-box'><h3>📦 월 낙찰 건수</h3><h2>{len(filtered_df)}건</h2><div style='color:gray; font-size:0.9em;'>(일평균 {avg_counts:.1f}건)</div></div>", unsafe_allow_html=True)
-                    with c5: st.markdown(f"<div class='summary-box'><h3>🤝 참여 고객수</h3><h2>{filtered_df['구매자'].nunique()}명</h2><div style='color:gray; font-size:0.9em;'>(일평균 {avg_cust:.1f}명)</div></div>", unsafe_allow_html=True)
+                    with c4: st.markdown(f"<div class='summary-box'><h3>📦 월 낙찰 건수</h3><h2>{month_view.count}건</h2><div style='color:gray; font-size:0.9em;'>(일평균 {avg_counts:.1f}건)</div></div>", unsafe_allow_html=True)
+                    with c5: st.markdown(f"<div class='summary-box'><h3>🤝 참여 고객수</h3><h2>{len(month_view.buyers())}명</h2><div style='color:gray; font-size:0.9em;'>(일평균 {avg_cust:.1f}명)</div></div>", unsafe_allow_html=True)
                     # ----------------------------------------------------
 
                     st.write("---")
                     st.subheader("📈 매출 흐름")
-                    daily_sales = filtered_df.groupby('경매일자_dt')['가격'].sum().reset_index()
-                    daily_sales['한글날짜'] = daily_sales['경매일자_dt'].apply(lambda x: f"{x.strftime('%m/%d')} ({['월','화','수','목','금','토','일'][x.weekday()]})")
-                    fig_daily = go.Figure()
-                    fig_daily.add_trace(go.Scatter(x=daily_sales['한글날짜'], y=daily_sales['가격'], mode='lines+markers', line=dict(color='#2ecc71', width=3), hovertemplate="%{x}<br>매출액: %{y:,.0f}원<extra></extra>"))
-                    fig_daily.update_xaxes(type='category'); fig_daily.update_layout(height=350, margin=dict(l=20, r=20, t=20, b=20)); st.plotly_chart(fig_daily, use_container_width=True)
+                    plot("month_daily", selected_month, df.attrs.get('data_version'), lambda: daily_sales_figure(month_view.daily['매출']))
 
                     st.write("---")
-                    g_col1, g_col2 = st.columns(2)
-                    with g_col1:
-                        st.subheader("🥧 구매자 점유율 (TOP 5)")
-                        b_share = filtered_df.groupby('구매자')['가격'].sum().sort_values(ascending=False).reset_index()
-                        top_b = b_share.head(5)
-                        others_b = pd.DataFrame([{'구매자': '기타', '가격': b_share.iloc[5:]['가격'].sum()}])
-                        b_pie_df = pd.concat([top_b, others_b])
-                        fig_b_pie = px.pie(b_pie_df, values='가격', names='구매자', hole=0.4, color_discrete_sequence=px.colors.sequential.RdBu)
-                        fig_b_pie.update_traces(textinfo='percent+label', hovertemplate="%{label}<br>%{value:,.0f}원")
-                        st.plotly_chart(fig_b_pie, use_container_width=True)
-                    with g_col2:
-                        st.subheader("🥧 판매자 점유율 (TOP 5)")
-                        s_share = filtered_df.groupby('판매자')['가격'].sum().sort_values(ascending=False).reset_index()
-                        top_s = s_share.head(5)
-                        others_s = pd.DataFrame([{'판매자': '기타', '가격': s_share.iloc[5:]['가격'].sum()}])
-                        s_pie_df = pd.concat([top_s, others_s])
-                        fig_s_pie = px.pie(s_pie_df, values='가격', names='판매자', hole=0.4, color_discrete_sequence=px.colors.sequential.Tealgrn)
-                        fig_s_pie.update_traces(textinfo='percent+label', hovertemplate="%{label}<br>%{value:,.0f}원")
-                        st.plotly_chart(fig_s_pie, use_container_width=True)
+                    pie_exp = st.expander("🥧 구매자/판매자 점유율 (TOP 5) 보기", key="month_share", on_change="rerun")
+                    if pie_exp.open:
+                        with pie_exp:
+                            g_col1, g_col2 = st.columns(2)
+                            for col, role, name in ((g_col1, '구매자', "month_buyer_pie"), (g_col2, '판매자', "month_seller_pie")):
+                                with col:
+                                    st.subheader(f"🥧 {role} 점유율 (TOP 5)")
+                                    plot(name, selected_month, df.attrs.get('data_version'), lambda: share_pie(month_view, role))
 
                     st.write("---")
                     cl, cr = st.columns(2)
                     with cl:
                         st.subheader("🏆 이달의 구매 TOP 10")
-                        mb = filtered_df.groupby('구매자')['가격'].sum().sort_values(ascending=False).head(10).reset_index()
-                        mb.index += 1; mb.columns=['고객명','구매금액']; mb['구매금액']=mb['구매금액'].map('{:,.0f}원'.format); st.table(mb)
+                        mb = month_view.buyers().head(10).reset_index()
+                        mb.index += 1; mb.columns=['고객명','구매금액']; paged_table(mb, "month_buyers", {'구매금액': '원'})
                     with cr:
                         st.subheader("💰 이달의 판매 TOP 10")
-                        ms = filtered_df.groupby('판매자')['가격'].sum().sort_values(ascending=False).head(10).reset_index()
-                        ms.index += 1; ms.columns=['고객명','판매금액']; ms['판매금액']=ms['판매금액'].map('{:,.0f}원'.format); st.table(ms)
+                        ms = month_view.sellers().head(10).reset_index()
+                        ms.index += 1; ms.columns=['고객명','판매금액']; paged_table(ms, "month_sellers", {'판매금액': '원'})
                     
                     st.write("---")
                     st.subheader("🔝 이달의 최고가 낙찰품 TOP 10")
-                    mt = filtered_df.sort_values(by='가격', ascending=False).head(10)[['경매일자', '품목', '가격', '구매자', '판매자']].reset_index(drop=True)
-                    mt['경매일자'] = mt['경매일자'].apply(get_ko_date)
-                    mt.index += 1; mt['가격'] = mt['가격'].map('{:,.0f}원'.format); st.table(mt)
+                    mt = month_view.top_lots(10)[['경매일자', '품목', '가격', '구매자', '판매자']].reset_index(drop=True)
+                    mt.index += 1; paged_table(mt, "month_lots", {'경매일자': ko_dates, '가격': '원'})
+
+                    st.write("---")
+                    st.subheader("📒 월간 회계 장부")
+                    month_start = pd.Timestamp(f"{selected_month}-01")
+                    ledger_download(df, members, date_index, selected_month, month_start, month_start + pd.offsets.MonthEnd(0))
                 else: st.info("데이터가 없습니다.")
 
             elif selected_person == "YEARLY_SUMMARY":
                 st.title(f"🏢 {selected_year}년 연간 경영 요약")
-                if not filtered_df.empty:
-                    total_sales = filtered_df['가격'].sum()
-                    unique_days_year = filtered_df['경매일자'].nunique()
+                year_view = cube.year(selected_year)
+                if not year_view.empty:
+                    total_sales = year_view.total_sales
+                    unique_days_year = year_view.n_days
                     avg_daily_sales_year = total_sales / unique_days_year if unique_days_year > 0 else 0
-                    temp_df = filtered_df.copy(); temp_df['월'] = temp_df['경매일자_dt'].dt.month
-                    unique_months = temp_df['월'].nunique()
+                    unique_months = year_view.daily['월'].nunique()
                     avg_monthly_sales = total_sales / unique_months if unique_months > 0 else 0
                     
                     y1, y2, y3 = st.columns(3)
@@ -539,30 +502,52 @@ else:
                     
                     st.write("---")
                     st.subheader("📊 월별 매출 흐름")
-                    yearly_trend = temp_df.groupby('월')['가격'].sum().reset_index()
-                    fig_yearly = px.line(yearly_trend, x='월', y='가격', markers=True, line_shape='linear', color_discrete_sequence=['#3498db'])
-                    fig_yearly.update_layout(xaxis=dict(tickmode='linear', dtick=1), height=350); st.plotly_chart(fig_yearly, use_container_width=True)
+                    plot("year_trend", selected_year, df.attrs.get('data_version'), lambda: monthly_trend_figure(year_view.daily))
 
                     col_l, col_r = st.columns(2)
                     with col_l:
                         st.subheader("🥇 연간 구매 왕 TOP 10")
-                        yb = filtered_df.groupby('구매자')['가격'].sum().sort_values(ascending=False).head(10).reset_index()
-                        yb.index += 1; yb.columns=['고객명', '구매금액']; yb['구매금액'] = yb['구매금액'].map('{:,.0f}원'.format); st.table(yb)
+                        yb = year_view.buyers().head(10).reset_index()
+                        yb.index += 1; yb.columns=['고객명', '구매금액']; paged_table(yb, "year_buyers", {'구매금액': '원'})
                     with col_r:
                         st.subheader("💰 연간 판매 왕 TOP 10")
-                        ys = filtered_df.groupby('판매자')['가격'].sum().sort_values(ascending=False).head(10).reset_index()
-                        ys.index += 1; ys.columns=['고객명', '판매금액']; ys['판매금액'] = ys['판매금액'].map('{:,.0f}원'.format); st.table(ys)
+                        ys = year_view.sellers().head(10).reset_index()
+                        ys.index += 1; ys.columns=['고객명', '판매금액']; paged_table(ys, "year_sellers", {'판매금액': '원'})
                     
                     st.write("---")
                     st.subheader("🔝 연간 최고가 낙찰품 TOP 50")
-                    yt = filtered_df.sort_values(by='가격', ascending=False).head(50)[['경매일자', '품목', '가격', '구매자', '판매자']].reset_index(drop=True)
-                    yt['경매일자'] = yt['경매일자'].apply(get_ko_date)
-                    yt.index += 1; yt['가격'] = yt['가격'].map('{:,.0f}원'.format); st.table(yt)
+                    yt = year_view.top_lots(50)[['경매일자', '품목', '가격', '구매자', '판매자']].reset_index(drop=True)
+                    yt.index += 1; paged_table(yt, "year_lots", {'경매일자': ko_dates, '가격': '원'})
+
+                    st.write("---")
+                    st.subheader("📒 연간 회계 장부")
+                    ledger_download(df, members, date_index, f"{selected_year}", pd.Timestamp(int(selected_year), 1, 1), pd.Timestamp(int(selected_year), 12, 31))
                 else: st.info("데이터가 없습니다.")
 
+            elif selected_person == "ITEM_SEARCH":
+                st.title("🔍 품목 검색")
+                if not item_query.strip():
+                    st.info("왼쪽에 품목명(일부)을 입력하세요. 띄어쓰기는 무시합니다.")
+                else:
+                    with span('item_search') as rec:
+                        hits = df.iloc[item_index.rows(item_query, row_lo, row_hi)[::-1]]
+                        rec['rows'] = len(hits)
+                    if hits.empty: st.info(f"'{item_query}' 이(가) 들어간 낙찰 내역이 없습니다.")
+                    else:
+                        overall, yearly = price_stats(hits)
+                        for col, (label, value) in zip(st.columns(5), overall.items()):
+                            col.metric(label, f"{value:,.0f}" + ("건" if label == '건수' else "원"))
+                        st.subheader("📈 연도별 낙찰가")
+                        paged_table(yearly.reset_index(), "item_years", {'평균': '원', '중앙값': '원', '최저': '원', '최고': '원'})
+                        st.subheader("📜 낙찰 내역 (최신순)")
+                        lots = hits[['경매일자', '품목', '가격', '구매자', '판매자']].reset_index(drop=True)
+                        lots.index += 1; paged_table(lots, "item_lots", {'경매일자': ko_dates, '가격': '원'})
+
             elif selected_person != "선택하세요":
                 member_row = df_members[df_members['닉네임'] == selected_person]
-                is_exempt = not member_row.empty and str(member_row.iloc[0]['수수료면제여부']).strip() == "면제"
+                if store: p_total = store.settle_one(members, selected_person, *period)
+                else: p_total = settle_one(df.iloc[nick_index.member_rows(selected_person, row_lo, row_hi)], members, selected_person)
+                is_exempt = bool(p_total['면제'])
                 st.title("📜 경매내역서 조회")
                 st.markdown(f"### {date_title}")
                 st.markdown(f"## 👤 {selected_person} 님의 상세 정보")
@@ -572,11 +557,11 @@ else:
                 i3.markdown(f"**🏠 주소**\n{member_row.iloc[0]['주소'] if not member_row.empty else '미등록'}")
                 if is_exempt: st.success("✨ 수수료 면제 대상 회원입니다")
                 st.write("---")
-                sell_data = filtered_df[filtered_df['판매자'] == selected_person].copy()
-                buy_data = filtered_df[filtered_df['구매자'] == selected_person].copy()
-                s_total = int(sell_data['가격'].sum()); s_fee = int(s_total * SELL_FEE_RATE); s_net = s_total - s_fee
-                b_total_raw = int(buy_data['가격'].sum()); b_fee = 0 if is_exempt else int(b_total_raw * DEFAULT_BUY_FEE_RATE); b_total_final = b_total_raw + b_fee
-                final_balance = s_net - b_total_final
+                sell_data = df.iloc[nick_index.rows('판매자', selected_person, row_lo, row_hi)]
+                buy_data = df.iloc[nick_index.rows('구매자', selected_person, row_lo, row_hi)]
+                s_total, s_fee, s_net = int(p_total['판매합계']), int(p_total['판매수수료']), int(p_total['판매정산'])
+                b_total_raw, b_fee, b_total_final = int(p_total['구매합계']), int(p_total['구매수수료']), int(p_total['구매청구'])
+                final_balance = int(p_total['정산금액'])
                 
                 c1, c2, c3 = st.columns(3)
                 with c1: st.metric("📤 판매 정산금", f"{s_net:,.0f}원"); st.caption(f"판매합계 {s_total:,.0f}원 - 수수료 {s_fee:,.0f}원")
@@ -586,15 +571,37 @@ else:
                 st.write("---")
                 col1, col2 = st.columns(2)
                 s_cols, b_cols = (['품목', '가격', '구매자'], ['품목', '가격', '판매자']) if view_mode == "일별 조회" else (['경매일자', '품목', '가격'], ['경매일자', '품목', '가격'])
+                inv_formats = {'가격': ''} if view_mode == "일별 조회" else {'경매일자': as_dates, '가격': ''}
+                # 내역서는 그대로 인쇄하므로 페이지 없이 전체 표시 (위 합계와 항상 맞음)
                 with col1:
                     st.markdown("### [판매 내역]")
                     if not sell_data.empty:
-                        disp_s = sell_data[s_cols].reset_index(drop=True); disp_s.index += 1; disp_s['가격'] = disp_s['가격'].map('{:,.0f}'.format); st.table(disp_s)
+                        disp_s = sell_data[s_cols].reset_index(drop=True); disp_s.index += 1
+                        paged_table(disp_s, f"inv_sell_{selected_person}", inv_formats, full=True)
                     else: st.write("판매 내역 없음")
                 with col2:
                     st.markdown("### [구매 내역]")
                     if not buy_data.empty:
-                        disp_b = buy_data[b_cols].reset_index(drop=True); disp_b.index += 1; disp_b['가격'] = disp_b['가격'].map('{:,.0f}'.format); st.table(disp_b)
+                        disp_b = buy_data[b_cols].reset_index(drop=True); disp_b.index += 1
+                        paged_table(disp_b, f"inv_buy_{selected_person}", inv_formats, full=True)
                     else: st.write("구매 내역 없음")
             else:
                 st.info("👈 왼쪽에서 날짜와 고객을 선택해 주세요.")
+
+        # ---------------------------------------------------------
+        # ⏱️ 성능 측정 (PROFILING=1 또는 관리자 패널에서 켰을 때만 기록)
+        # ---------------------------------------------------------
+        record = finish_run(PROFILE_LOG)
+        if st.session_state.get('is_admin'):
+            with st.sidebar.expander("⏱️ 성능 측정 (관리자)"):
+                if PROFILING: st.caption("PROFILING=1 로 항상 측정 중")
+                else: st.checkbox("이 세션 측정 켜기", key="profiling")
+                if record:
+                    st.markdown(f"**이번 실행: {record['total_ms']:,.0f}ms** ({record.get('view', '')})")
+                    st.dataframe(pd.DataFrame(record['spans']), hide_index=True)
+                if recent_runs:
+                    st.markdown("**최근 실행**")
+                    st.dataframe(pd.DataFrame([{'시각': r['ts'], '화면': r.get('view'), 'ms': r['total_ms']} for r in reversed(recent_runs)]), hide_index=True)
+                st.markdown("**캐시 적중**")
+                st.dataframe(pd.DataFrame(cache_stats).T, use_container_width=True)
+                st.caption(f"로그 파일: {PROFILE_LOG}")
@@ -0,0 +1,51 @@
+# 경매 데이터 메모리 사용량: 기존 구성(날짜 객체 + datetime, 문자열 닉네임)과 압축 구성 비교
+#   python benchmarks/bench_memory.py [행 수] [연 수]
+import io
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from loader import read_auction_raw, clean_auction, enrich_auction  # noqa: E402
+from parsing import clean_prices, parse_auction_hours  # noqa: E402
+from synthetic import make_sheets  # noqa: E402
+
+
+# --- 가상 경매 시트를 원본 CSV 형식 그대로 읽음 ---
+def synthetic_raw(n, years):
+    buf = io.StringIO()
+    make_sheets(n, years)[0].to_csv(buf, index=False)
+    buf.seek(0)
+    return read_auction_raw(buf)
+
+
+# --- 압축 전 구성 (경매일자 = datetime.date 객체, 경매일자_dt, 문자열 닉네임, 낙찰시간 원문) ---
+def legacy_frame(raw):
+    df_a = raw.copy()
+    df_a['가격'] = clean_prices(df_a['가격'])
+    df_a['정렬시간'] = parse_auction_hours(df_a['낙찰시간'])
+    df_a['경매일자_dt'] = pd.to_datetime(df_a['경매일자'], errors='coerce')
+    df_a = df_a.dropna(subset=['경매일자_dt'])
+    df_a['경매일자'] = df_a['경매일자_dt'].dt.date
+    return df_a.sort_values('경매일자_dt', kind='stable').reset_index(drop=True)
+
+
+def report(name, df):
+    usage = df.memory_usage(deep=True)
+    print(f"[{name}] 합계 {usage.sum() / 2 ** 20:,.1f} MiB")
+    for col, b in usage.drop('Index').items():
+        print(f"  {col:<8} {str(df[col].dtype)[:20]:<20} {b / 2 ** 20:9,.1f} MiB")
+    return usage.sum()
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    years = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    raw = synthetic_raw(n, years)
+    before = report("기존", legacy_frame(raw))
+    t0 = time.perf_counter(); compact = enrich_auction(clean_auction(raw)); t1 = time.perf_counter()
+    after = report("압축", compact)
+    print(f"{n:,}행 / {years}년: {before / 2 ** 20:,.1f} MiB → {after / 2 ** 20:,.1f} MiB (x{before / after:.1f}), 정제 {t1 - t0:.2f}s")
@@ -0,0 +1,76 @@
+# 가격 정제 / 낙찰시간 해석: 기존 행 단위 함수와 parsing.py 일괄 처리 결과 비교 + 속도 측정
+#   python benchmarks/bench_parsing.py [행 수]
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from parsing import clean_price, clean_prices, parse_auction_hours  # noqa: E402
+
+
+# --- 기존 app.py 의 행 단위 함수 (비교 기준) ---
+def parse_auction_time(time_val):
+    try:
+        t_str = str(time_val).strip()
+        if not t_str or t_str == 'nan': return None
+        t_str = t_str.replace("오후", "PM").replace("오전", "AM")
+        for fmt in ("%p %I:%M:%S", "%p %I:%M", "%H:%M:%S", "%H:%M"):
+            try:
+                dt_obj = datetime.strptime(t_str, fmt)
+                h = dt_obj.hour
+                return h if h >= 14 else h + 24
+            except: continue
+        return None
+    except: return None
+
+
+# 실제 시트에서 나오는 지저분한 값들
+PRICE_CORPUS = [
+    "1,234,000", "-50,000", " 35,000 ", "35000", "35000.0", "12,345.67", "-1,234.9", "", " ", "nan", "NaN",
+    "abc", "₩10,000", "10,000원", "1e5", "+7,000", "1_000", "１２３", "inf", "-inf", "0", "-0", "1,2,3",
+    "--5", "5-", ".5", "-.5", None, np.nan, 120000, -3000, 4500.0, "9,999,999,999",
+]
+TIME_CORPUS = [
+    "오후 2:15:30", "오후 12:00", "오전 12:30:00", "오전 1:05", "오전 2:59:59", "오후 11:59", "14:30:00", "9:05",
+    "00:10", "23:59:59", "24:00", "25:00", "오후 13:00", "오후 0:30", "오후2:30", "  오후  3:10  ", "pm 3:10",
+    "PM 03:07:09", "오후 3:7:9", "3:60", "3:59:61", "3:59:62", "", " ", "nan", "미정", "오후 3시", None, np.nan,
+    "오전 오후 3:10", "15:30:00.5", "1:2:3", "012:30",
+]
+
+
+def check(name, corpus, legacy, vectorized):
+    series = pd.Series(corpus, dtype=object)
+    expected = [legacy(v) for v in corpus]
+    got = vectorized(series).tolist()
+    bad = [(v, e, g) for v, e, g in zip(corpus, expected, got) if not (e == g or (e is None and pd.isna(g)))]
+    print(f"{name}: {len(corpus) - len(bad)}/{len(corpus)} 일치")
+    for v, e, g in bad:
+        print(f"  {v!r}: 기존={e!r} 일괄={g!r}")
+    return not bad
+
+
+def bench(name, values, legacy, vectorized):
+    t0 = time.perf_counter(); legacy_out = values.apply(legacy); t1 = time.perf_counter()
+    fast_out = vectorized(values); t2 = time.perf_counter()
+    same = (legacy_out.isna() & fast_out.isna()) | (legacy_out == fast_out)
+    print(f"{name}: 기존 {t1 - t0:.3f}s / 일괄 {t2 - t1:.3f}s (x{(t1 - t0) / max(t2 - t1, 1e-9):.1f}), 일치 {bool(same.all())}")
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    ok = check("가격", PRICE_CORPUS, clean_price, clean_prices)
+    ok &= check("낙찰시간", TIME_CORPUS, parse_auction_time, parse_auction_hours)
+    rng = np.random.default_rng(0)
+    # 대부분은 정상 값(서로 다른 값이 많음), 일부는 말뭉치의 지저분한 값
+    amounts = rng.integers(-300, 5000, n) * 1000
+    prices = pd.Series([f"{a:,}" for a in amounts]).where(rng.random(n) > 0.05, pd.Series(rng.choice(PRICE_CORPUS[:24], n)))
+    hours, minutes, seconds = rng.integers(14, 26, n) % 24, rng.integers(0, 60, n), rng.integers(0, 60, n)
+    times = pd.Series([f"{'오후' if h >= 12 else '오전'} {h % 12 or 12}:{m:02d}:{s:02d}" for h, m, s in zip(hours, minutes, seconds)])
+    times = times.where(rng.random(n) > 0.05, pd.Series(rng.choice(TIME_CORPUS[:28], n)))
+    bench(f"가격 {n:,}행", prices, clean_price, clean_prices)
+    bench(f"낙찰시간 {n:,}행", times, parse_auction_time, parse_auction_hours)
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,121 @@
+# 화면 모드별 실행 시간 측정 (가상 데이터 + Streamlit AppTest, 네트워크 없이 실행)
+#   python benchmarks/bench_views.py [--sizes 10000 100000 1000000] [--out 결과.json]
+#   python benchmarks/bench_views.py --compare 이전.json 이후.json
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+MODES = ["일별 조회", "기간별 조회", "일별 요약", "월별 요약", "연간 요약", "👤 회원 정보 조회"]
+
+
+def _timed(fn, repeat):
+    runs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter(); fn(); runs.append(time.perf_counter() - t0)
+    return {'median': statistics.median(runs), 'runs': runs}
+
+
+# --- 한 가지 크기 측정 (설정 모듈과 캐시가 섞이지 않도록 크기마다 별도 프로세스에서 실행) ---
+def measure(n_rows, years, repeat):
+    from synthetic import write_sheets
+    work = tempfile.mkdtemp(prefix=f"bench_{n_rows}_")
+    auction_csv, members_csv = write_sheets(work, n_rows, years)
+    os.environ.update(AUCTION_CSV_URL=auction_csv, MEMBERS_CSV_URL=members_csv, SNAPSHOT_DIR=os.path.join(work, 'snapshot'))
+
+    import pandas as pd
+    from streamlit.testing.v1 import AppTest
+    from events import EventLedger
+    from loader import read_auction, read_members
+    from settlement import member_table
+
+    result = {'rows': n_rows, 'years': years}
+    at = AppTest.from_file(os.path.join(ROOT, 'app.py'), default_timeout=1800)
+    at.session_state['logged_in'] = True
+    t0 = time.perf_counter(); at.run(); result['cold_load'] = time.perf_counter() - t0
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    result['warm_rerun'] = _timed(at.run, repeat)
+
+    df, df_members = read_auction(auction_csv), read_members(members_csv)
+    members = member_table(df_members)
+    heavy = df['구매자'].value_counts().index[0]
+    last = df['경매일자'].max()
+    last_date = pd.Timestamp(last, unit='D').date()
+
+    views = {}
+    for mode in MODES:
+        at.sidebar.radio[0].set_value(mode).run()
+        if mode == "일별 조회":
+            at.sidebar.selectbox[0].select(last_date).run()
+            at.sidebar.selectbox[1].select(heavy).run()
+        elif mode == "기간별 조회":
+            at.sidebar.date_input[0].set_value(last_date - pd.Timedelta(days=30)).run()
+            at.sidebar.date_input[1].set_value(last_date).run()
+            at.sidebar.selectbox[0].select(heavy).run()
+        elif mode == "👤 회원 정보 조회":
+            at.sidebar.selectbox[0].select(heavy).run()
+        if at.exception:
+            raise RuntimeError(f"{mode}: {at.exception[0].value}")
+        views[mode] = _timed(at.run, repeat)
+    # 사이드바 배송비 이벤트 명단 (장부를 새로 만드는 비용)
+    views["배송비 이벤트 명단"] = _timed(lambda: EventLedger.build(df, members, None).standings(), repeat)
+    result['views'] = views
+    return result
+
+
+def compare(before_path, after_path):
+    before, after = (json.load(open(p)) for p in (before_path, after_path))
+    for size, b in before['sizes'].items():
+        a = after['sizes'].get(size)
+        if not a: continue
+        print(f"[{int(size):,}행] 최초 로드 {b['cold_load']:.2f}s → {a['cold_load']:.2f}s")
+        for view, bv in b['views'].items():
+            if view in a['views']:
+                av = a['views'][view]['median']
+                print(f"  {view:<12} {bv['median'] * 1000:9.1f}ms → {av * 1000:9.1f}ms (x{bv['median'] / max(av, 1e-9):.2f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="화면 모드별 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--years', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--out', default=os.path.join(ROOT, 'benchmarks', 'results', 'bench_views.json'))
+    parser.add_argument('--compare', nargs=2, metavar=('BEFORE', 'AFTER'))
+    parser.add_argument('--child', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.compare:
+        return compare(*args.compare)
+    if args.child:
+        print(json.dumps(measure(args.child, args.years, args.repeat)))
+        return
+
+    rev = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    report = {'version': rev, 'python': platform.python_version(), 'created': time.strftime('%Y-%m-%d %H:%M:%S'), 'sizes': {}}
+    for n in args.sizes:
+        proc = subprocess.run([sys.executable, __file__, '--child', str(n), '--years', str(args.years), '--repeat', str(args.repeat)],
+                              capture_output=True, text=True)
+        if proc.returncode:
+            sys.exit(f"{n:,}행 측정 실패:\n{proc.stderr[-2000:]}")
+        report['sizes'][str(n)] = res = json.loads(proc.stdout.strip().splitlines()[-1])
+        print(f"[{n:,}행] 최초 로드 {res['cold_load']:.2f}s")
+        for view, v in res['views'].items():
+            print(f"  {view:<12} {v['median'] * 1000:9.1f}ms")
+    os.makedirs(os.path.dirname(args.out), exist_ok=True)
+    with open(args.out, 'w') as f:
+        json.dump(report, f, ensure_ascii=False, indent=1)
+    print(f"저장: {args.out}")
+
+
+if __name__ == '__main__':
+    main()
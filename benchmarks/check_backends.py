@@ -0,0 +1,86 @@
+# pandas 경로와 SQLite 저장소(BACKEND=sqlite)의 정산 금액이 같은지 확인 (가상 데이터, 다르면 종료 코드 1)
+#   python benchmarks/check_backends.py [행 수] [연 수]
+import io
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from loader import read_auction, read_members  # noqa: E402
+from parsing import ordinal_dates  # noqa: E402
+from rollup import RollupCube  # noqa: E402
+from settlement import member_table, settle, settle_one  # noqa: E402
+from store import SqliteStore  # noqa: E402
+from synthetic import make_sheets  # noqa: E402
+from views import date_bounds, NicknameIndex  # noqa: E402
+
+
+def _csv(frame):
+    buf = io.StringIO()
+    frame.to_csv(buf, index=False)
+    buf.seek(0)
+    return buf
+
+
+# 인덱스(고객명/일자)는 문자열로 맞춰 비교 (pandas 쪽은 범주형, SQLite 쪽은 문자열)
+def _plain(frame):
+    keys = [f"_k{i}" for i in range(frame.index.nlevels)]
+    frame = frame.rename_axis(keys).reset_index()
+    return frame.astype({k: str for k in keys}).set_index(keys).sort_index()
+
+
+def _same(name, expected, actual, failures):
+    expected, actual = _plain(expected), _plain(actual)
+    try:
+        pd.testing.assert_frame_equal(expected, actual, check_dtype=False, check_index_type=False, check_names=False)
+    except AssertionError as e:
+        failures.append(f"{name}: {e}")
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    years = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    auction, member_sheet = make_sheets(n, years)
+    df, df_members = read_auction(_csv(auction)), read_members(_csv(member_sheet))
+    df.attrs['data_version'] = 'check'
+    members = member_table(df_members)
+    store = SqliteStore(os.path.join(tempfile.mkdtemp(prefix='store_'), 'auction.sqlite'))
+    t0 = time.perf_counter(); store.mirror(df, df_members); print(f"{n:,}행 옮기기 {time.perf_counter() - t0:.2f}s")
+
+    rng = np.random.default_rng(0)
+    days = ordinal_dates(np.unique(df['경매일자'].to_numpy())).astype(object)
+    nick_index = NicknameIndex(df)
+    failures = []
+    # 기간별 (고객 전체 정산표)
+    for _ in range(20):
+        start, end = sorted(rng.choice(days, 2))
+        lo, hi = date_bounds(df, start, end)
+        _same(f"기간 {start}~{end}", settle(df.iloc[lo:hi], members), store.settle(members, start, end), failures)
+    # 일별/월별 요약 (집계 큐브와 비교)
+    cube = RollupCube.build(df)
+    for day in rng.choice(days, 10):
+        _same(f"일별 요약 {day}", cube.day(day).settled(members), store.settle(members, day, day), failures)
+    for ym in cube.months():
+        view = cube.month(ym)
+        _same(f"월별 요약 {ym}", view.settled(members), store.settle(members, view.daily.index.min(), view.daily.index.max()), failures)
+    # 회원별 (전체 기간 + 일자별 + 기간 내)
+    start, end = days[len(days) // 2], days[-1]
+    lo, hi = date_bounds(df, start, end)
+    for nick in list(members.index[:30]) + ['비회원A', '없는회원']:
+        rows = df.iloc[nick_index.member_rows(nick)]
+        _same(f"회원 {nick}", settle_one(rows, members, nick).to_frame().T, store.settle_one(members, nick).to_frame().T, failures)
+        by_day = settle(rows, members, by=['경매일자'])
+        by_day = by_day[by_day.index.get_level_values('고객명') == nick]
+        _same(f"회원 {nick} 일자별", by_day, store.settle(members, nick=nick, by_day=True), failures)
+        rows = df.iloc[nick_index.member_rows(nick, lo, hi)]
+        _same(f"회원 {nick} 기간", settle_one(rows, members, nick).to_frame().T, store.settle_one(members, nick, start, end).to_frame().T, failures)
+
+    for f in failures[:10]:
+        print(f)
+    print(f"불일치 {len(failures)}건")
+    sys.exit(1 if failures else 0)
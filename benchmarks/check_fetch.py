@@ -0,0 +1,111 @@
+# 시트 다운로드 점검: 로컬 HTTP 서버(구글 시트 대역)로 동시 다운로드, 재시도, 조건부 요청, 실패 시 스냅샷 유지 확인
+#   python benchmarks/check_fetch.py   (문제가 있으면 종료 코드 1)
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic import make_sheets  # noqa: E402
+
+DELAY = 0.5  # 요청마다 서버 응답 지연(초) → 두 시트를 동시에 받는지 확인
+
+
+class SheetServer(BaseHTTPRequestHandler):
+    sheets = {}        # 경로 → CSV 바이트
+    fail_next = 0      # 이 횟수만큼 503 응답
+    requests = []      # (경로, 응답 코드)
+    active = peak = 0  # 동시에 처리 중인 요청 수 (최대값)
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with self.lock:
+            SheetServer.active += 1; SheetServer.peak = max(SheetServer.peak, SheetServer.active)
+        time.sleep(DELAY)
+        with self.lock:
+            SheetServer.active -= 1
+            failing = SheetServer.fail_next > 0
+            if failing: SheetServer.fail_next -= 1
+        body = self.sheets.get(self.path)
+        etag = f'"{hashlib.md5(body).hexdigest()}"' if body is not None and self.path == '/auction.csv' else None  # 회원 시트는 ETag 없음
+        if failing or body is None:
+            code = 503 if failing else 404
+        elif etag and self.headers.get('If-None-Match') == etag:
+            code = 304
+        else:
+            code = 200
+        with self.lock:
+            SheetServer.requests.append((self.path, code))
+        self.send_response(code)
+        if etag: self.send_header('ETag', etag)
+        if code == 200:
+            self.send_header('Content-Type', 'text/csv; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def check(name, ok, failures):
+    print(f"{'OK ' if ok else '실패'} {name}")
+    if not ok: failures.append(name)
+
+
+def main():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SheetServer)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    work = tempfile.mkdtemp(prefix='fetch_')
+    os.environ.update(AUCTION_CSV_URL=f"{base}/auction.csv", MEMBERS_CSV_URL=f"{base}/members.csv")
+    from snapshot import refresh_snapshot, load_snapshot
+
+    auction, members = make_sheets(20000, 2)
+    SheetServer.sheets = {'/auction.csv': auction.to_csv(index=False).encode(), '/members.csv': members.to_csv(index=False).encode()}
+    failures = []
+    directory = os.path.join(work, 'snapshot')
+
+    t0 = time.perf_counter(); df_a, df_m = refresh_snapshot(directory); elapsed = time.perf_counter() - t0
+    check(f"처음 받기 {len(df_a):,}행, 두 시트 동시 다운로드 ({elapsed:.2f}s)", len(df_a) > 0 and len(df_m) == len(members) and SheetServer.peak == 2, failures)
+    version = df_a.attrs['data_version']
+
+    SheetServer.requests.clear()
+    t0 = time.perf_counter(); df_a2, _ = refresh_snapshot(directory); elapsed = time.perf_counter() - t0
+    codes = dict(SheetServer.requests)
+    check(f"변경 없음: 경매 304, 회원 해시 일치 → 다시 정제하지 않음 ({elapsed:.2f}s)",
+          codes == {'/auction.csv': 304, '/members.csv': 200} and df_a2.attrs['data_version'] == version and elapsed < 2 * DELAY, failures)
+
+    members.loc[0, '이름'] = '바뀐이름'
+    SheetServer.sheets['/members.csv'] = members.to_csv(index=False).encode()
+    df_a3, df_m3 = refresh_snapshot(directory)
+    check("회원 시트만 변경 → 회원만 다시 읽음", df_m3.loc[0, '이름'] == '바뀐이름' and len(df_a3) == len(df_a) and df_a3.attrs['data_version'] != version, failures)
+
+    SheetServer.fail_next = 2
+    SheetServer.requests.clear()
+    refresh_snapshot(directory)
+    check("일시 오류(503) 후 재시도 성공", sum(code == 503 for _, code in SheetServer.requests) == 2, failures)
+
+    saved = load_snapshot(directory)[2]['data_version']
+    server.shutdown(); server.server_close()
+    try:
+        refresh_snapshot(directory); check("서버 중단 시 예외", False, failures)
+    except Exception:
+        snap = load_snapshot(directory)
+        check("서버 중단 → 마지막 스냅샷 유지", snap is not None and snap[2]['data_version'] == saved, failures)
+
+    shutil.rmtree(work, ignore_errors=True)
+    print(f"실패 {len(failures)}건")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
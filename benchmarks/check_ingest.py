@@ -0,0 +1,55 @@
+# 증분 반영 점검: 시트를 고친 뒤 바뀐 파티션만 다시 정제한 결과가 처음부터 정제한 결과와 같은지 확인 (다르면 종료 코드 1)
+#   python benchmarks/check_ingest.py [행 수]
+import io
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from ingest import ingest_auction  # noqa: E402
+from loader import read_auction_raw  # noqa: E402
+from synthetic import make_sheets  # noqa: E402
+
+
+def raw_of(sheet):
+    return read_auction_raw(io.StringIO(sheet.to_csv(index=False)))
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    auction, _ = make_sheets(n, 2)
+    auction = auction.reset_index(drop=True)
+    df, manifest, _ = ingest_auction(raw_of(auction))
+    failures = []
+
+    def step(name, sheet, changed):
+        nonlocal df, manifest
+        raw = raw_of(sheet)
+        df, manifest, stats = ingest_auction(raw, df, manifest)
+        full = ingest_auction(raw)[0]
+        try:
+            pd.testing.assert_frame_equal(df, full)
+            ok = stats['changed'] == changed
+        except AssertionError as e:
+            print(e); ok = False
+        print(f"{'OK ' if ok else '실패'} {name} (다시 정제한 파티션 {stats['changed']}개)")
+        if not ok: failures.append(name)
+
+    last = auction.index[auction['경매일자'] == auction['경매일자'].iloc[-1]]
+    edited = auction.copy(); edited.loc[last[0], '가격'] = '1,234,000'
+    step("마지막 경매 가격 수정", edited, 1)
+    day = auction.index[auction['경매일자'] == auction['경매일자'].iloc[len(auction) // 2]]
+    swapped = edited.copy(); swapped.loc[[day[0], day[1]]] = swapped.loc[[day[1], day[0]]].to_numpy()
+    step("같은 날 두 행 순서 바꿈", swapped, 1)
+    shuffled = swapped.copy(); shuffled.loc[day] = swapped.loc[day].iloc[::-1].to_numpy()
+    step("같은 날 행 순서 뒤집음", shuffled, 1)
+    step("변경 없음", shuffled, 0)
+    step("하루 삭제", shuffled.drop(day), 0)
+    print(f"실패 {len(failures)}건")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
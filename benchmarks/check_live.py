@@ -0,0 +1,76 @@
+# 실시간 경매 모드 점검: 오늘 행 추가/수정/앞부분 삽입 시 증분 집계가 전체 재집계와 같은지 확인 (다르면 종료 코드 1)
+#   python benchmarks/check_live.py [행 수]
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from live import LiveFeed, live_auction_date  # noqa: E402
+from loader import read_auction  # noqa: E402
+from rollup import RollupCube  # noqa: E402
+from settlement import member_table  # noqa: E402
+from synthetic import make_sheets  # noqa: E402
+
+
+# 시트 전체를 처음부터 집계한 오늘 결과
+def expected_view(path, day):
+    df = read_auction(path)
+    return RollupCube.build(df[df['경매일자'] == (pd.Timestamp(day) - pd.Timestamp(0)).days]).day(day)
+
+
+def same(a, b, members):
+    pairs = [(a.hourly(), b.hourly()), (a.settled(members), b.settled(members)),
+             (a.buyers().head(10), b.buyers().head(10)), (a.sellers().head(10), b.sellers().head(10))]
+    try:
+        for x, y in pairs:
+            pd.testing.assert_frame_equal(x.rename(index=str).to_frame() if isinstance(x, pd.Series) else x.rename(index=str),
+                                          y.rename(index=str).to_frame() if isinstance(y, pd.Series) else y.rename(index=str),
+                                          check_dtype=False, check_index_type=False, check_names=False)
+        pd.testing.assert_frame_equal(a.top_lots(10).reset_index(drop=True).astype(str), b.top_lots(10).reset_index(drop=True).astype(str))
+        return a.total_sales == b.total_sales and a.count == b.count
+    except AssertionError as e:
+        print(e)
+        return False
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    day = live_auction_date()
+    auction, member_sheet = make_sheets(n, 2, end=pd.Timestamp(day) - pd.Timedelta(days=1))
+    members = member_table(member_sheet)
+    today = auction.tail(600).assign(경매일자=day.strftime('%Y-%m-%d'))
+    history = auction.iloc[:-600]
+    path = os.path.join(tempfile.mkdtemp(prefix='live_'), 'auction.csv')
+    feed, failures = LiveFeed(path), []
+
+    def step(name, sheet, kind, changed=True):
+        sheet.to_csv(path, index=False)
+        before = feed.revision
+        t0 = time.perf_counter(); feed.poll(day, 0); elapsed = time.perf_counter() - t0
+        ok = feed.revision == before + changed and same(feed.view(), expected_view(path, day), members)
+        print(f"{'OK ' if ok else '실패'} {name} ({kind}, {elapsed * 1000:.0f}ms, 오늘 {feed.view().count}건)")
+        if not ok: failures.append(name)
+
+    step("처음 확인 (오늘 400건)", pd.concat([history, today.iloc[:400]]), "재집계")
+    step("새 낙찰 100건 추가", pd.concat([history, today.iloc[:500]]), "증분")
+    step("새 낙찰 100건 더 추가", pd.concat([history, today]), "증분")
+    edited = today.copy(); edited.iloc[10, edited.columns.get_loc('가격')] = '9,999,000'
+    step("오늘 앞부분 가격 수정", pd.concat([history, edited]), "재집계")
+    step("지난 경매 행 삽입 → 오늘 시작 위치 다시 찾음", pd.concat([history.iloc[:1], history, edited]), "오늘 행 그대로", changed=False)
+    ok = feed._offset == len(history) + 1
+    print(f"{'OK ' if ok else '실패'} 오늘 시작 위치 {feed._offset}")
+    if not ok: failures.append("시작 위치")
+    step("지난 경매 행 삭제 → 오늘 행이 위로 밀려도 빠짐없이 읽음", pd.concat([history.iloc[5:], edited]), "오늘 행 그대로", changed=False)
+    ok = feed._offset == len(history) - 5
+    print(f"{'OK ' if ok else '실패'} 오늘 시작 위치 {feed._offset}")
+    if not ok: failures.append("삭제 후 시작 위치")
+    print(f"실패 {len(failures)}건")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
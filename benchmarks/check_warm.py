@@ -0,0 +1,93 @@
+# 백그라운드 준비 작업 점검: 첫 준비, 새 버전으로 교체하는 동안 화면 쪽 대기 시간, 증분 갱신 결과, 시트 오류 시 유지 확인
+#   python benchmarks/check_warm.py [행 수]   (문제가 있으면 종료 코드 1)
+#   BACKEND=sqlite python benchmarks/check_warm.py   (SQLite 저장소도 확인)
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic import make_sheets  # noqa: E402
+
+
+def check(name, ok, failures):
+    print(f"{'OK ' if ok else '실패'} {name}")
+    if not ok: failures.append(name)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    work = tempfile.mkdtemp(prefix='warm_')
+    auction_path, members_path = os.path.join(work, 'auction.csv'), os.path.join(work, 'members.csv')
+    os.environ.update(AUCTION_CSV_URL=auction_path, MEMBERS_CSV_URL=members_path)
+    from events import EventLedger
+    from search import ItemIndex
+    from settlement import member_table
+    from warm import Warmer
+
+    auction, members = make_sheets(n, 3)
+    history, latest = auction.iloc[:-2000], auction.iloc[-2000:]
+    history.to_csv(auction_path, index=False); members.to_csv(members_path, index=False)
+    failures = []
+
+    # interval 을 스냅샷 만료 시간으로 주면 확인할 때마다 시트를 새로 받음
+    warmer = Warmer(os.path.join(work, 'snapshot'), interval=600)
+    t0 = time.perf_counter(); warmer.start(); first = warmer.current(); elapsed = time.perf_counter() - t0
+    check(f"첫 준비 {len(first.df):,}행 ({elapsed:.1f}s)", first is not None and len(first.df) == len(history), failures)
+
+    # 새 낙찰 추가 → 준비 작업이 새 묶음을 만드는 동안 화면 쪽 읽기는 기다리지 않아야 함
+    pd.concat([history, latest]).to_csv(auction_path, index=False)
+    waits, seen, stop = [], set(), threading.Event()
+
+    def reader():
+        while not stop.is_set():
+            t = time.perf_counter(); state = warmer.current(); waits.append(time.perf_counter() - t)
+            seen.add((state.version, state.item_index.version, state.ledger.version, len(state.df), int(state.date_index.offsets[-1])))
+            time.sleep(0.005)
+
+    thread = threading.Thread(target=reader); thread.start()
+    t0 = time.perf_counter(); swapped = warmer.warm(); elapsed = time.perf_counter() - t0
+    stop.set(); thread.join()
+    state = warmer.current()
+    check(f"새 버전 준비 후 교체 ({elapsed:.1f}s)", swapped and state.version != first.version and len(state.df) == len(auction), failures)
+    check(f"교체 중 화면 읽기 {len(waits)}회, 최대 {max(waits) * 1000:.2f}ms", max(waits) < 0.01, failures)
+    check("읽은 묶음은 항상 한 버전으로 일관됨", all(v == i == l and rows == end for v, i, l, rows, end in seen), failures)
+    if state.store is not None:
+        check("교체 후에도 이전 묶음의 저장소는 자기 버전", first.store.version == first.version and state.store.version == state.version, failures)
+
+    fresh_members = member_table(state.df_members)
+    index = ItemIndex(state.df)
+    same_search = all(np.array_equal(state.item_index.rows(q), index.rows(q)) for q in ['청자', '화병 1', '반닫이', '족'])
+    check("품목 색인 증분 갱신 = 새로 만든 색인", same_search, failures)
+    blank = state.df['품목'].isna().to_numpy()
+    check(f"빈 품목 {blank.sum()}행은 검색에 나오지 않음", blank.any() and not any(blank[state.item_index.rows(q)].any() for q in ['청자', '화병 1', '족', '1']), failures)
+    check("배송비 이벤트 명단 증분 갱신 = 새로 계산", state.standings == EventLedger.build(state.df, fresh_members).standings(), failures)
+
+    # 낙찰시간만 고쳐도 새 버전 (시간대별 집계/차트 캐시가 버전 키를 씀)
+    # 정렬시간은 시 단위이므로 시가 바뀌게 고침
+    hour = '오후 3:00:00' if state.df['정렬시간'].fillna(0).iloc[-1] != 15 else '오후 4:00:00'
+    timed = pd.concat([history, latest]); timed.iloc[-1, timed.columns.get_loc('낙찰시간')] = hour
+    timed.to_csv(auction_path, index=False)
+    swapped = warmer.warm()
+    check("낙찰시간만 수정 → 새 버전으로 교체", swapped and warmer.current().version != state.version, failures)
+    state = warmer.current()
+
+    # 같은 데이터 → 교체하지 않음, 시트 오류 → 기존 묶음 유지
+    check("변경 없음 → 묶음 유지", warmer.warm() is False and warmer.current() is state, failures)
+    os.remove(auction_path)
+    swapped = warmer.warm()
+    check("시트 오류 → 기존 스냅샷/묶음 유지", swapped is False and warmer.current() is state, failures)
+
+    shutil.rmtree(work, ignore_errors=True)
+    print(f"실패 {len(failures)}건")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
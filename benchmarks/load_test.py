@@ -0,0 +1,235 @@
+# 동시 접속 부하 시험: 가상 시트로 app.py 를 로컬에 띄우고, 로그인한 세션 여러 개가 동시에 화면을 돌아다님
+#   python benchmarks/load_test.py [세션 수] [세션당 동작 수] [행 수] [회차]
+#   → 동작별 응답 시간 p50/p95, 세션당 서버 메모리 증가(회차마다), 캐시 적중률(load_data 등)
+# 브라우저 대신 Streamlit 웹소켓 프로토콜(BackMsg/ForwardMsg)을 직접 주고받음 (같은 회차의 세션은 동시에 시작)
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+import numpy as np
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from websockets.sync.client import connect
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from config import APP_PASSWORD  # noqa: E402
+from synthetic import ITEMS, write_sheets  # noqa: E402
+
+TIMEOUT = 120  # 한 번의 화면 실행을 기다리는 최대 시간(초)
+MODES = ["일별 조회", "기간별 조회", "일별 요약", "월별 요약", "연간 요약", "👤 회원 정보 조회", "🔍 품목 검색"]
+
+
+# --- 브라우저 한 개 (위젯 값을 기억해 두었다가 다시 실행할 때마다 함께 보냄) ---
+class Session:
+    def __init__(self, ws):
+        self.ws = ws
+        self.widgets = {}  # 위젯 id → (종류, proto, fragment id)
+        self.states = {}   # 위젯 id → 보낼 WidgetState
+        self.errors = []
+
+    # 다시 실행하고 끝날 때까지 받은 위젯을 기록 → 걸린 시간(초)
+    def rerun(self, fragment_id=''):
+        msg = BackMsg()
+        msg.rerun_script.widget_states.widgets.extend(self.states.values())
+        msg.rerun_script.fragment_id = fragment_id
+        t0 = time.perf_counter()
+        self.ws.send(msg.SerializeToString())
+        seen = {}
+        while True:
+            fm = ForwardMsg()
+            fm.ParseFromString(self.ws.recv(timeout=TIMEOUT))
+            kind = fm.WhichOneof('type')
+            if kind == 'delta' and fm.delta.WhichOneof('type') == 'new_element':
+                element = fm.delta.new_element
+                name = element.WhichOneof('type')
+                proto = getattr(element, name)
+                if name == 'exception': self.errors.append(proto.message)
+                elif 'id' in proto.DESCRIPTOR.fields_by_name and proto.id: seen[proto.id] = (name, proto, fm.delta.fragment_id)
+            elif kind == 'script_finished' and fm.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                break
+        elapsed = time.perf_counter() - t0
+        # 부분 실행(fragment)은 그 안의 위젯만 다시 오므로 합치고, 전체 실행이면 화면에 남은 위젯만 유지
+        self.widgets = {**self.widgets, **seen} if fragment_id else seen
+        self.states = {k: s for k, s in self.states.items() if k in self.widgets and not s.trigger_value}
+        return elapsed
+
+    # 라벨(앞부분), key, placeholder 로 위젯 찾기
+    def find(self, name, kind=None):
+        for wid, (k, proto, fragment) in self.widgets.items():
+            if kind and k != kind: continue
+            if getattr(proto, 'label', '').startswith(name) or wid.endswith('-' + name) or getattr(proto, 'placeholder', None) == name:
+                return wid, proto, fragment
+        return None
+
+    def options(self, name):
+        hit = self.find(name)
+        return list(hit[1].options) if hit else []
+
+    def set(self, name, value):
+        wid, proto, fragment = self.find(name)
+        state = WidgetState(id=wid)
+        if self.widgets[wid][0] == 'button': state.trigger_value = True
+        elif isinstance(value, bool): state.bool_value = value
+        else: state.string_value = value
+        self.states[wid] = state
+        return self.rerun(fragment)
+
+    # key 가 prefix 로 시작하는 체크박스의 key 목록 (위젯 id = "$$ID-해시-key")
+    def checkboxes(self, prefix):
+        return [wid.split('-', 2)[-1] for wid, (k, _, _) in self.widgets.items() if k == 'checkbox' and wid.split('-', 2)[-1].startswith(prefix)]
+
+
+# --- 세션 하나의 시나리오: 로그인 → 화면 모드/날짜/고객/정산 체크를 무작위로 바꿈 ---
+def browse(port, n_actions, seed, record):
+    rng = np.random.default_rng(seed)
+    pick = lambda xs: xs[rng.integers(len(xs))]
+    with connect(f"ws://127.0.0.1:{port}/_stcore/stream", subprotocols=['streamlit'], max_size=None, open_timeout=TIMEOUT) as ws:
+        session = Session(ws)
+        record('접속', session.rerun())
+        password = session.find('Password')[0]
+        session.states[password] = WidgetState(id=password, string_value=APP_PASSWORD)
+        record('로그인', session.set('로그인', True))
+        done = 0
+        while done < n_actions:
+            mode = pick(MODES)
+            record(f'화면:{mode}', session.set('모드 선택', mode)); done += 1
+            if mode in ("일별 조회", "일별 요약") and session.options('📅'):
+                record('날짜 선택', session.set('📅', pick(session.options('📅')[:20]))); done += 1
+            elif mode in ("월별 요약", "연간 요약") and session.options('📅'):
+                record('기간 선택', session.set('📅', pick(session.options('📅')))); done += 1
+            elif mode == "👤 회원 정보 조회":
+                record('회원 선택', session.set('찾으실 회원', pick(session.options('찾으실 회원')))); done += 1
+            elif mode == "🔍 품목 검색":
+                record('품목 검색', session.set('item_query', pick(ITEMS).split()[-1])); done += 1
+            if mode in ("일별 조회", "기간별 조회") and len(session.options('👤 고객 선택')) > 1:
+                record('고객 선택', session.set('👤 고객 선택', pick(session.options('👤 고객 선택')[1:]))); done += 1
+            if mode == "일별 요약" and session.checkboxes(('in_', 'out_')):
+                key = pick(session.checkboxes(('in_', 'out_')))
+                record('정산 체크', session.set(key, not session.find(key)[1].value)); done += 1
+    return session.errors
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def rss_mb(pid):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            return next(int(line.split()[1]) for line in f if line.startswith('VmRSS')) / 1024
+    except (OSError, StopIteration):
+        return float('nan')  # /proc 이 없는 OS
+
+
+def start_server(work, n_rows):
+    auction, members = write_sheets(os.path.join(work, 'sheets'), n_rows)
+    port = free_port()
+    env = dict(os.environ, AUCTION_CSV_URL=auction, MEMBERS_CSV_URL=members, SNAPSHOT_DIR=os.path.join(work, 'snapshot'),
+               SETTLED_DB=os.path.join(work, 'settled.sqlite'), STORE_DB=os.path.join(work, 'auction.sqlite'),
+               PROFILING='1', PROFILE_LOG=os.path.join(work, 'profile.jsonl'))
+    server = subprocess.Popen([sys.executable, '-m', 'streamlit', 'run', os.path.join(ROOT, 'app.py'), '--server.port', str(port),
+                               '--server.headless', 'true', '--server.enableXsrfProtection', 'false',
+                               '--server.disconnectedSessionTTL', '1', '--browser.gatherUsageStats', 'false'],
+                              env=env, cwd=work, stdout=subprocess.DEVNULL, stderr=open(os.path.join(work, 'server.log'), 'w'))
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return server, port
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("서버가 시작되지 않음 (server.log 확인)")
+
+
+# --- 한 회차: 세션 n 개를 동시에 시작해 모두 끝날 때까지 기다림 ---
+def run_wave(port, n_sessions, n_actions, seed, latencies, errors):
+    lock, barrier = threading.Lock(), threading.Barrier(n_sessions)
+
+    def record(name, seconds):
+        with lock: latencies[name].append(seconds * 1000)
+
+    def worker(i):
+        barrier.wait()
+        try:
+            found = browse(port, n_actions, seed + i, record)
+        except Exception as e:
+            found = [f"{type(e).__name__}: {e}"]
+        with lock: errors.extend(found)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n_sessions)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+
+
+# 구조화 로그의 캐시 span (cache=hit/miss) → 이름별 적중률
+def cache_hit_rates(log_path):
+    counts = defaultdict(lambda: {'hit': 0, 'miss': 0})
+    if os.path.exists(log_path):
+        with open(log_path, encoding='utf-8') as f:
+            for line in f:
+                for sp in json.loads(line)['spans']:
+                    if sp.get('cache') in ('hit', 'miss'): counts[sp['name']][sp['cache']] += 1
+    return counts
+
+
+def main():
+    n_sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    n_actions = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    n_rows = int(sys.argv[3]) if len(sys.argv) > 3 else 50000
+    waves = int(sys.argv[4]) if len(sys.argv) > 4 else 3
+    work = tempfile.mkdtemp(prefix='load_')
+    server, port = start_server(work, n_rows)
+    latencies, errors = defaultdict(list), []
+    try:
+        print(f"서버 시작 (포트 {port}), 메모리 {rss_mb(server.pid):.0f}MB")
+        run_wave(port, 1, len(MODES), 0, defaultdict(list), errors)  # 데이터 읽기/색인 생성을 먼저 끝내 둠
+        time.sleep(2)
+        base = rss_mb(server.pid)
+        print(f"예열 후 메모리 {base:.0f}MB (경매 {n_rows:,}행)")
+        print(f"{'회차':>4} {'세션':>5} {'소요(s)':>8} {'메모리(MB)':>10} {'세션당 증가(MB)':>15}")
+        prev = base
+        for wave in range(1, waves + 1):
+            t0 = time.perf_counter()
+            run_wave(port, n_sessions, n_actions, wave * 1000, latencies, errors)
+            elapsed = time.perf_counter() - t0
+            time.sleep(3)  # 끊긴 세션 정리 (disconnectedSessionTTL=1)
+            rss = rss_mb(server.pid)
+            print(f"{wave:>4} {n_sessions:>5} {elapsed:>8.1f} {rss:>10.0f} {(rss - prev) / n_sessions:>15.2f}")
+            prev = rss
+        print("  (첫 회차 이후에도 회차마다 계속 늘면 세션 단위 메모리 누수 의심)")
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    print(f"\n{'동작':<20} {'횟수':>6} {'p50(ms)':>9} {'p95(ms)':>9} {'최대(ms)':>9}")
+    for name, values in sorted(latencies.items(), key=lambda kv: -np.percentile(kv[1], 95)):
+        print(f"{name:<20} {len(values):>6} {np.percentile(values, 50):>9.0f} {np.percentile(values, 95):>9.0f} {max(values):>9.0f}")
+    every = np.concatenate([v for v in latencies.values()])
+    print(f"{'전체':<20} {len(every):>6} {np.percentile(every, 50):>9.0f} {np.percentile(every, 95):>9.0f} {every.max():>9.0f}")
+
+    print(f"\n{'캐시':<20} {'적중':>7} {'미스':>6} {'적중률':>7}")
+    for name, c in sorted(cache_hit_rates(os.path.join(work, 'profile.jsonl')).items(), key=lambda kv: kv[0] != 'load_data'):
+        total = c['hit'] + c['miss']
+        print(f"{name:<20} {c['hit']:>7} {c['miss']:>6} {c['hit'] / total if total else 0:>7.1%}")
+
+    print(f"\n오류 {len(errors)}건")
+    for e in sorted(set(errors))[:10]: print("  " + e.splitlines()[0][:200])
+    shutil.rmtree(work, ignore_errors=True)
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == '__main__':
+    main()
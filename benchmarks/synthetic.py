@@ -0,0 +1,86 @@
+# 벤치마크용 가상 시트 생성 (load_data 가 읽는 경매/회원 시트와 같은 한글 컬럼 구성)
+#   python benchmarks/synthetic.py [행 수] [저장 폴더] [연 수]
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+AUCTION_HEADER = ['경매일자', '판매자', '품목', '가격', '구매자', '낙찰시간']
+MEMBER_HEADER = ['닉네임', '이름', '전화번호', '주소', '수수료면제여부', '전미수', '금액', '마지막혜택일', '계좌번호']
+ITEMS = ['청자 화병', '백자 항아리', '고려 청동거울', '민화 족자', '옛날 반닫이', '놋쇠 촛대', '분청 사발', '목각 인형', '자개 함', '옹기 단지']
+
+
+# --- 지저분한 가격 문자열 (쉼표/공백/소수점/빈칸/잘못된 값, 반품은 음수) ---
+def _prices(rng, n):
+    values = rng.integers(1, 5000, n) * 1000
+    returns = rng.random(n) < 0.02
+    values[returns] = -rng.integers(1, 300, returns.sum()) * 1000
+    style = rng.random(n)
+    text = np.where(style < 0.6, [f"{v:,}" for v in values], values.astype(str)).astype(object)
+    text[(style >= 0.8) & (style < 0.85)] = [f" {v:,} " for v in values[(style >= 0.8) & (style < 0.85)]]
+    text[(style >= 0.85) & (style < 0.88)] = [f"{v}.0" for v in values[(style >= 0.85) & (style < 0.88)]]
+    text[(style >= 0.88) & (style < 0.895)] = ""
+    text[(style >= 0.895) & (style < 0.9)] = "확인필요"
+    return text
+
+
+# --- 낙찰시간 (오후 2시 ~ 새벽 2시, 오후/오전 표기와 24시간 표기 혼용, 일부 빈칸) ---
+def _times(rng, n):
+    hours = rng.integers(14, 26, n) % 24
+    minutes, seconds = rng.integers(0, 60, n), rng.integers(0, 60, n)
+    style = rng.random(n)
+    out = []
+    for h, m, s, r in zip(hours, minutes, seconds, style):
+        if r < 0.5: out.append(f"{'오후' if h >= 12 else '오전'} {h % 12 or 12}:{m:02d}:{s:02d}")
+        elif r < 0.65: out.append(f"{'오후' if h >= 12 else '오전'} {h % 12 or 12}:{m:02d}")
+        elif r < 0.97: out.append(f"{h}:{m:02d}:{s:02d}")
+        else: out.append("")
+    return out
+
+
+# --- 경매 시트 + 회원 시트 (여러 해, 주 2회 경매, 회원 일부는 면제/혜택일 보유) ---
+def make_sheets(n_rows, years=5, n_members=None, end=None, seed=0):
+    rng = np.random.default_rng(seed)
+    n_members = n_members or max(100, min(5000, n_rows // 200))
+    end = pd.Timestamp(end or pd.Timestamp.now().normalize())
+    calendar = pd.date_range(end - pd.DateOffset(years=years), end)
+    nights = calendar[calendar.weekday.isin([2, 5])]  # 수/토 경매
+    nicks = np.array([f"회원{i:05d}" for i in range(n_members)] + ["비회원A", "비회원B"], dtype=object)
+    # 소수의 단골이 많이 사고파는 분포
+    weights = 1.0 / np.arange(1, len(nicks) + 1) ** 0.8
+    weights /= weights.sum()
+    seller = rng.choice(nicks, n_rows, p=weights)
+    buyer = rng.choice(nicks, n_rows, p=np.roll(weights, len(nicks) // 3))
+    auction = pd.DataFrame({
+        '경매일자': rng.choice(nights.strftime('%Y-%m-%d'), n_rows),
+        '판매자': seller,
+        '품목': [f"{ITEMS[i % len(ITEMS)]} {i}" for i in rng.integers(0, 10 * n_rows, n_rows)],
+        '가격': _prices(rng, n_rows),
+        '구매자': buyer,
+        '낙찰시간': _times(rng, n_rows),
+    }, columns=AUCTION_HEADER).sort_values('경매일자', kind='stable')
+    auction.loc[rng.random(n_rows) < 0.005, '품목'] = None  # 품목을 비워 둔 행
+
+    exempt = rng.choice(["면제", "", "", "", "", "", "", "", " 면제", ""], n_members)
+    benefit = np.where(rng.random(n_members) < 0.3, rng.choice(nights.strftime('%Y-%m-%d'), n_members), "")
+    members = pd.DataFrame({
+        '닉네임': nicks[:n_members], '이름': [f"이름{i}" for i in range(n_members)],
+        '전화번호': [f"010-{i // 10000:04d}-{i % 10000:04d}" for i in range(n_members)], '주소': [f"서울시 {i % 25}구 {i}" for i in range(n_members)],
+        '수수료면제여부': exempt, '전미수': 0, '금액': 0, '마지막혜택일': benefit, '계좌번호': [f"국민 {i:06d}" for i in range(n_members)],
+    }, columns=MEMBER_HEADER)
+    return auction, members
+
+
+def write_sheets(directory, n_rows, years=5, seed=0):
+    os.makedirs(directory, exist_ok=True)
+    auction, members = make_sheets(n_rows, years, seed=seed)
+    paths = os.path.join(directory, 'auction.csv'), os.path.join(directory, 'members.csv')
+    auction.to_csv(paths[0], index=False)
+    members.to_csv(paths[1], index=False)
+    return paths
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(write_sheets(sys.argv[2] if len(sys.argv) > 2 else 'synthetic', n, int(sys.argv[3]) if len(sys.argv) > 3 else 5))
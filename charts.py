@@ -0,0 +1,64 @@
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+# 일별 추이 차트의 최대 점 개수 (넘으면 주/월/분기/연 단위로 합산해 차트 크기를 일정하게 유지)
+MAX_POINTS = 120
+_BUCKETS = [('W-SAT', lambda d: f"{d:%y/%m/%d}~"), ('MS', lambda d: f"{d:%Y-%m}"),
+            ('QS', lambda d: f"{d.year} {d.quarter}분기"), ('YS', lambda d: f"{d.year}년")]
+_WEEKDAYS = ['월', '화', '수', '목', '금', '토', '일']
+
+
+# --- 일별 매출(날짜 인덱스) → (라벨, 금액) 점 목록, 점이 많으면 큰 단위로 합산 ---
+def bucket_sales(daily, max_points=MAX_POINTS):
+    if len(daily) <= max_points:
+        return [f"{d:%m/%d} ({_WEEKDAYS[d.weekday()]})" for d in daily.index], daily
+    for freq, label in _BUCKETS:
+        summed = daily.resample(freq, label='left', closed='left').sum()
+        if len(summed) <= max_points or freq == 'YS':
+            return [label(d) for d in summed.index], summed
+
+
+# --- 일별 요약: 시간대별 매출(막대) + 낙찰건수(선) ---
+def hourly_figure(time_agg):
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig.add_trace(go.Bar(
+        x=time_agg['시간대'], y=time_agg['매출금액'], name="매출액",
+        marker_color='#3498db', opacity=0.7,
+        hovertemplate="%{x}<br>매출액: %{y:,.0f}원<extra></extra>"
+    ), secondary_y=False)
+    fig.add_trace(go.Scatter(
+        x=time_agg['시간대'], y=time_agg['낙찰건수'], name="낙찰건수", mode='lines+markers+text',
+        line=dict(color='#e74c3c', width=3), text=time_agg['낙찰건수'].apply(lambda x: f"{int(x)}건" if x > 0 else ""),
+        textposition="top center", hovertemplate="%{x}<br>낙찰건수: %{y}건<extra></extra>"
+    ), secondary_y=True)
+    fig.update_layout(hovermode="x unified", legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1), height=450)
+    return fig
+
+
+# --- 일별 매출 흐름 (기간이 길면 bucket_sales 로 합산) ---
+def daily_sales_figure(daily):
+    labels, sales = bucket_sales(daily)
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=labels, y=sales, mode='lines+markers', line=dict(color='#2ecc71', width=3), hovertemplate="%{x}<br>매출액: %{y:,.0f}원<extra></extra>"))
+    fig.update_xaxes(type='category'); fig.update_layout(height=350, margin=dict(l=20, r=20, t=20, b=20))
+    return fig
+
+
+# --- 구매자/판매자 점유율 (TOP 5 + 기타) ---
+def share_pie(view, role):
+    share = (view.buyers() if role == '구매자' else view.sellers()).rename('가격').rename_axis(role).reset_index()
+    others = pd.DataFrame([{role: '기타', '가격': share.iloc[5:]['가격'].sum()}])
+    colors = px.colors.sequential.RdBu if role == '구매자' else px.colors.sequential.Tealgrn
+    fig = px.pie(pd.concat([share.head(5), others]), values='가격', names=role, hole=0.4, color_discrete_sequence=colors)
+    fig.update_traces(textinfo='percent+label', hovertemplate="%{label}<br>%{value:,.0f}원")
+    return fig
+
+
+# --- 연간 요약: 월별 매출 흐름 ---
+def monthly_trend_figure(daily):
+    trend = daily.groupby('월')['매출'].sum().rename('가격').reset_index()
+    fig = px.line(trend, x='월', y='가격', markers=True, line_shape='linear', color_discrete_sequence=['#3498db'])
+    fig.update_layout(xaxis=dict(tickmode='linear', dtick=1), height=350)
+    return fig
@@ -0,0 +1,40 @@
+import os
+
+# ==========================================
+# 🛠️ 사장님 전용 설정
+# ==========================================
+SHEET_ID = "1hbrT_QQWwCrxsG0Jg81xAJH9_gLzc2ORtmava8tqqUw"
+URL_AUCTION = os.environ.get("AUCTION_CSV_URL", f"https://docs.google.com/spreadsheets/d/{SHEET_ID}/export?format=csv&gid=0")
+URL_MEMBERS = os.environ.get("MEMBERS_CSV_URL", f"https://docs.google.com/spreadsheets/d/{SHEET_ID}/export?format=csv&gid=773051258")
+
+SELL_FEE_RATE = 0.14
+DEFAULT_BUY_FEE_RATE = 0.05
+APP_PASSWORD = "4989" 
+
+# 로컬 스냅샷 (구글 시트를 받아 정제한 데이터를 디스크에 보관)
+SNAPSHOT_DIR = os.environ.get("SNAPSHOT_DIR", ".snapshot")
+SNAPSHOT_MAX_AGE = 600  # 이 시간(초)이 지나면 백그라운드에서 새로 받아옴
+WARM_INTERVAL = int(os.environ.get("WARM_INTERVAL", "60"))  # 백그라운드 준비 작업이 스냅샷을 확인하는 간격(초), 메타 파일만 읽고 시트는 SNAPSHOT_MAX_AGE 마다 받음
+FETCH_TIMEOUT = (5, 60)  # 시트 다운로드 (연결, 읽기) 제한 시간(초)
+FETCH_RETRIES = 3        # 일시 오류(5xx, 연결 끊김) 재시도 횟수
+
+# 실시간 경매 모드 (일별 요약에서 켜면 오늘 경매 행만 이 간격(초)으로 다시 확인)
+LIVE_POLL_SECONDS = int(os.environ.get("LIVE_POLL_SECONDS", "30"))
+
+# 성능 측정 (PROFILING=1 이면 항상 측정, 아니면 관리자 패널에서 켬)
+ADMIN_PASSWORD = os.environ.get("ADMIN_PASSWORD")  # 설정하면 이 비밀번호로 로그인 시 관리자 패널 표시
+PROFILING = os.environ.get("PROFILING") == "1"
+PROFILE_LOG = os.environ.get("PROFILE_LOG", "profile.jsonl")
+
+# 일별 요약의 입금/정산 완료 표시 저장 파일
+SETTLED_DB = os.environ.get("SETTLED_DB", "settled.sqlite")
+
+# 화면에서 내려받는 회계 장부의 최대 경매 건수 (완성된 파일이 통째로 서버 메모리에 올라가므로, 넘는 기간은 python export.py 로)
+LEDGER_UI_MAX_LOTS = int(os.environ.get("LEDGER_UI_MAX_LOTS", "500000"))
+
+# 집계 저장소: "pandas"(기본, 메모리에서 계산) 또는 "sqlite"(로컬 DB에 옮겨 두고 SQL 로 집계)
+# sqlite 는 정산 합계만 SQL 로 계산하고 화면용 pandas 집계/색인은 그대로 만듦 → 메모리/준비 시간은 줄지 않고 옮기는 작업만 더해짐
+# DB 파일은 데이터 버전마다 STORE_DB.<버전> 으로 만듦
+BACKEND = os.environ.get("BACKEND", "pandas")
+STORE_DB = os.environ.get("STORE_DB", "auction.sqlite")
+# ==========================================
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+from parsing import ordinal_dates
+
+EVENT_CYCLE = 10000000      # 1000만원마다 리셋
+EVENT_MIN_AMOUNT = 3000000  # 300만원 이상일 때만 명단에 표시
+
+
+# --- 행 지문 (추가된 행만 반영할 수 있는지 판단용, 데이터 버전에도 쓰므로 낙찰시간(정렬시간)까지 포함) ---
+def row_hashes(df):
+    return pd.util.hash_pandas_object(df[['경매일자', '판매자', '품목', '가격', '구매자', '정렬시간']], index=False).to_numpy()
+
+
+def fingerprint(hashes):
+    return int(hashes.sum()) % 2 ** 64
+
+
+def member_key(members):
+    return int(pd.util.hash_pandas_object(members['마지막혜택일'].astype(str), index=True).sum())
+
+
+# --- 마지막 혜택일 이후 구매 합계 (회원만, 구매자 첫 등장 순서 유지) ---
+def _purchase_totals(rows, members):
+    buyers = rows['구매자']
+    last_benefit = pd.to_datetime(members['마지막혜택일'], errors='coerce')
+    cutoff = last_benefit.reindex(buyers.to_numpy(dtype=object)).to_numpy(dtype='datetime64[D]')
+    after = pd.Series(np.isnat(cutoff) | (ordinal_dates(rows['경매일자']) > cutoff), index=rows.index)
+    totals = rows[buyers.isin(members.index) & after].groupby('구매자', observed=True)['가격'].sum()
+    order = pd.Index(pd.unique(buyers.dropna()))
+    order = order[order.isin(members.index)]
+    return totals.reindex(order, fill_value=0).astype('int64')
+
+
+class EventLedger:
+    def __init__(self, totals, n_rows, fingerprint, members_key, version):
+        self.totals = totals
+        self.n_rows = n_rows
+        self.fingerprint = fingerprint
+        self.members_key = members_key
+        self.version = version
+
+    @classmethod
+    def build(cls, df, members, version=None):
+        hashes = row_hashes(df)
+        return cls(_purchase_totals(df, members), len(df), fingerprint(hashes), member_key(members), version)
+
+    # 새로 추가된 행에 등장한 구매자만 갱신
+    def extend(self, new_rows, members, version=None):
+        added = _purchase_totals(new_rows, members)
+        new_names = added.index.difference(self.totals.index, sort=False)
+        totals = self.totals.reindex(self.totals.index.append(new_names), fill_value=0)
+        totals = totals + added.reindex(totals.index, fill_value=0)
+        combined = (self.fingerprint + fingerprint(row_hashes(new_rows))) % 2 ** 64
+        return EventLedger(totals, self.n_rows + len(new_rows), combined, self.members_key, version)
+
+    # 기존 장부의 행이 그대로 앞부분에 있으면 증분 갱신, 아니면 전체 재계산
+    def refresh(self, df, members, version=None):
+        if member_key(members) != self.members_key or len(df) < self.n_rows:
+            return EventLedger.build(df, members, version)
+        hashes = row_hashes(df)
+        if fingerprint(hashes[:self.n_rows]) != self.fingerprint:
+            return EventLedger.build(df, members, version)
+        return self.extend(df.iloc[self.n_rows:], members, version)
+
+    # (현재 누적, 완주 횟수) - 합계가 마이너스(반품 초과)면 0으로 처리
+    def status(self, nickname):
+        total = int(self.totals.get(nickname, 0))
+        if total <= 0:
+            return 0, 0
+        return total % EVENT_CYCLE, total // EVENT_CYCLE
+
+    def standings(self, min_amount=EVENT_MIN_AMOUNT):
+        totals = self.totals[self.totals > 0]
+        amt = totals % EVENT_CYCLE
+        picked = amt[amt >= min_amount].sort_values(ascending=False, kind='stable')
+        cycles = totals[picked.index] // EVENT_CYCLE
+        return [{'nick': b, 'amt': int(a), 'cycle': int(c)} for b, a, c in zip(picked.index, picked, cycles)]
@@ -0,0 +1,161 @@
+# 회계 장부 내보내기: 기간 안의 고객·경매일자별 판매/구매 합계, 수수료, 정산금액 (화면과 같은 면제 규칙)
+#   python export.py --month 2025-05 --out 장부_2025-05.csv
+#   python export.py --year 2024 --format parquet --out 장부_2024.parquet --auction 경매.csv --members 회원.csv
+# 경매 데이터를 날짜 경계에 맞춘 조각으로 나눠 조각마다 정산해 바로 파일에 씀 → 기간이 길어도 메모리 사용은 조각 크기만큼
+import argparse
+import importlib.util
+import io
+import threading
+import time
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from config import SNAPSHOT_DIR
+from invoices import load_sources
+from parsing import ordinal_dates
+from settlement import SETTLE_COLS, member_table, settle
+from views import date_bounds
+
+CHUNK_ROWS = 200000      # 한 번에 정산하는 경매 행 수 (같은 날 행은 나누지 않음)
+XLSX_MAX_ROWS = 1000000  # 엑셀 시트 하나의 최대 행 수(1,048,576) 전에 다음 시트로 넘김
+EXPORT_SLOTS = 2         # 동시에 만들 수 있는 장부 수
+
+LEDGER_COLS = ['경매일자', '고객명', '이름'] + SETTLE_COLS + ['면제']
+FORMATS = {'csv': 'text/csv', 'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'parquet': 'application/vnd.apache.parquet'}
+_SCHEMA = pa.schema([('경매일자', pa.date32()), ('고객명', pa.string()), ('이름', pa.string())]
+                    + [(c, pa.int64()) for c in SETTLE_COLS] + [('면제', pa.bool_())])
+
+# 화면에서 누른 큰 내보내기가 한꺼번에 몰리면 다른 세션이 함께 느려지므로 프로세스 전체에서 EXPORT_SLOTS 개까지만,
+# 자리가 없으면 줄 세우지 않고 바로 거절 (화면은 export_busy() 로 먼저 확인해 안내)
+_slots = threading.BoundedSemaphore(EXPORT_SLOTS)
+
+
+def export_busy():
+    if not _slots.acquire(blocking=False):
+        return True
+    _slots.release()
+    return False
+
+
+# --- 장부 조각 (날짜순, 한 조각 안에서는 경매일자 → 고객명 순) ---
+def ledger_chunks(df, members, lo, hi, chunk_rows=CHUNK_ROWS):
+    days = df['경매일자'].to_numpy()
+    start = lo
+    while start < hi:
+        end = min(int(days.searchsorted(days[min(start + chunk_rows, hi) - 1], 'right')), hi)
+        table = settle(df.iloc[start:end], members, by=['경매일자']).reset_index()
+        table['경매일자'] = ordinal_dates(table['경매일자'])
+        table['고객명'] = table['고객명'].astype(str)
+        table['이름'] = members['이름'].reindex(table['고객명']).fillna('').astype(str).to_numpy()
+        yield table[LEDGER_COLS].sort_values(['경매일자', '고객명'], ignore_index=True)
+        start = end
+
+
+def _write_csv(chunks, out):
+    text = io.TextIOWrapper(out, encoding='utf-8-sig', newline='')  # 엑셀에서 한글이 깨지지 않도록 BOM
+    rows = 0
+    for chunk in chunks:
+        chunk.to_csv(text, header=rows == 0, index=False)
+        rows += len(chunk)
+    if rows == 0: pd.DataFrame(columns=LEDGER_COLS).to_csv(text, index=False)
+    text.flush(); text.detach()
+    return rows
+
+
+def _write_parquet(chunks, out):
+    rows = 0
+    with pq.ParquetWriter(out, _SCHEMA) as writer:
+        for chunk in chunks:
+            writer.write_table(pa.Table.from_pandas(chunk, schema=_SCHEMA, preserve_index=False))
+            rows += len(chunk)
+    return rows
+
+
+# xlsx 는 xlsxwriter 가 설치되어 있을 때만 지원 (행을 쓰는 즉시 임시 파일로 내보내는 constant_memory 모드)
+def _write_xlsx(chunks, out):
+    import xlsxwriter
+    book = xlsxwriter.Workbook(out, {'constant_memory': True})
+    money = book.add_format({'num_format': '#,##0'})
+    sheet, row, rows = None, XLSX_MAX_ROWS, 0
+    for chunk in chunks:
+        chunk = chunk.assign(경매일자=chunk['경매일자'].dt.strftime('%Y-%m-%d'), 면제=chunk['면제'].map({True: '면제', False: ''}))
+        for values in chunk.to_numpy(dtype=object).tolist():
+            if row == XLSX_MAX_ROWS:
+                sheet, row = book.add_worksheet(f"장부{len(book.worksheets()) + 1}"), 1
+                sheet.write_row(0, 0, LEDGER_COLS)
+                sheet.set_column(3, 3 + len(SETTLE_COLS) - 1, 14, money)
+            sheet.write_row(row, 0, values)
+            row += 1
+        rows += len(chunk)
+    if sheet is None:
+        book.add_worksheet("장부1").write_row(0, 0, LEDGER_COLS)
+    book.close()
+    return rows
+
+
+_WRITERS = {'csv': _write_csv, 'xlsx': _write_xlsx, 'parquet': _write_parquet}
+
+
+# 이 환경에서 쓸 수 있는 형식 (xlsxwriter 가 없으면 xlsx 제외)
+def available_formats():
+    return [f for f in FORMATS if f != 'xlsx' or importlib.util.find_spec('xlsxwriter') is not None]
+
+
+# --- 행 범위 [lo, hi) 의 장부를 out(바이너리 파일 객체 또는 경로)에 씀 → 장부 행 수 ---
+# wait=False 면 자리가 없을 때 기다리지 않고 RuntimeError
+def export_ledger(df, members, lo, hi, out, fmt='csv', chunk_rows=CHUNK_ROWS, wait=True):
+    if not _slots.acquire(blocking=wait):
+        raise RuntimeError(f"다른 장부 내보내기 {EXPORT_SLOTS}건이 진행 중입니다. 잠시 후 다시 시도하세요.")
+    try:
+        if isinstance(out, str):
+            with open(out, 'wb') as f:
+                return _WRITERS[fmt](ledger_chunks(df, members, lo, hi, chunk_rows), f)
+        return _WRITERS[fmt](ledger_chunks(df, members, lo, hi, chunk_rows), out)
+    finally:
+        _slots.release()
+
+
+def _period(args):
+    if args.month:
+        start = pd.Timestamp(f"{args.month}-01")
+        return start, start + pd.offsets.MonthEnd(0)
+    if args.year:
+        return pd.Timestamp(int(args.year), 1, 1), pd.Timestamp(int(args.year), 12, 31)
+    return pd.Timestamp(args.start), pd.Timestamp(args.end or args.start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="회계 장부 내보내기 (고객·경매일자별 수수료/정산금액)")
+    parser.add_argument('--month', help="월 (YYYY-MM)")
+    parser.add_argument('--year', help="연도 (YYYY)")
+    parser.add_argument('--start', help="기간 시작일 (YYYY-MM-DD)")
+    parser.add_argument('--end', help="기간 종료일 (YYYY-MM-DD)")
+    parser.add_argument('--auction', help="경매 시트 CSV (없으면 로컬 스냅샷 사용)")
+    parser.add_argument('--members', help="회원 시트 CSV")
+    parser.add_argument('--snapshot', default=SNAPSHOT_DIR, help="스냅샷 폴더")
+    parser.add_argument('--format', choices=list(FORMATS), help="출력 형식 (기본: --out 확장자, 없으면 csv)")
+    parser.add_argument('--out', help="저장 파일 (기본: 장부_<기간>.<형식>)")
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS, help="한 번에 정산하는 경매 행 수")
+    args = parser.parse_args(argv)
+    if not (args.month or args.year or args.start) or (args.auction and not args.members):
+        parser.error("--month, --year, --start/--end 중 하나를, CSV를 쓸 때는 --auction 과 --members 를 함께 지정하세요")
+    fmt = args.format or (args.out.rsplit('.', 1)[-1].lower() if args.out and args.out.rsplit('.', 1)[-1].lower() in FORMATS else 'csv')
+    if fmt == 'xlsx':
+        try:
+            import xlsxwriter  # noqa: F401
+        except ImportError:
+            parser.error("XLSX 출력에는 xlsxwriter 패키지가 필요합니다 (pip install xlsxwriter)")
+
+    t0 = time.perf_counter()
+    df, df_members = load_sources(args.auction, args.members, args.snapshot)
+    start, end = _period(args)
+    out = args.out or f"장부_{args.month or args.year or start.strftime('%Y%m%d') + end.strftime('-%Y%m%d')}.{fmt}"
+    lo, hi = date_bounds(df, start, end)
+    rows = export_ledger(df, member_table(df_members), lo, hi, out, fmt, args.chunk_rows)
+    print(f"장부 {rows:,}행 (경매 {hi - lo:,}건) → {out} ({time.perf_counter() - t0:.1f}s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+import hashlib
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import FETCH_TIMEOUT, FETCH_RETRIES
+
+CHUNK_SIZE = 1 << 16
+
+_session = None
+_session_lock = threading.Lock()
+
+
+# --- 프로세스 전체가 같이 쓰는 HTTP 세션 (연결 재사용, 일시 오류는 간격을 늘려가며 재시도) ---
+def get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(total=FETCH_RETRIES, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                          allowed_methods=('GET',), raise_on_status=False)
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry)
+            session = requests.Session()
+            session.mount('http://', adapter); session.mount('https://', adapter)
+            _session = session
+        return _session
+
+
+# --- 시트 하나 받기 → (내용 또는 None(지난번과 같음), 다음 요청에 쓸 ETag/Last-Modified/해시) ---
+def fetch_sheet(url, known=None):
+    known = known or {}
+    if not url.startswith(('http://', 'https://')):  # 로컬 CSV 파일 (벤치마크/점검용)
+        with open(url, 'rb') as f:
+            body = f.read()
+        digest = hashlib.sha256(body).hexdigest()
+        return (None if digest == known.get('sha256') else body), {'sha256': digest}
+    headers = {}
+    if known.get('etag'): headers['If-None-Match'] = known['etag']
+    if known.get('last_modified'): headers['If-Modified-Since'] = known['last_modified']
+    with get_session().get(url, headers=headers, timeout=FETCH_TIMEOUT, stream=True) as resp:
+        if resp.status_code == 304:
+            return None, known
+        resp.raise_for_status()
+        # 받는 대로 해시를 계산 (ETag 를 주지 않는 구글 시트 내보내기도 내용이 같으면 다시 읽지 않음)
+        digest, buf = hashlib.sha256(), io.BytesIO()
+        for chunk in resp.iter_content(CHUNK_SIZE):
+            digest.update(chunk); buf.write(chunk)
+        validators = {'etag': resp.headers.get('ETag'), 'last_modified': resp.headers.get('Last-Modified'), 'sha256': digest.hexdigest()}
+    return (None if validators['sha256'] == known.get('sha256') else buf.getvalue()), validators
+
+
+# --- 여러 시트를 동시에 받기 {이름: (내용 또는 None, 검증값)} (하나라도 실패하면 예외) ---
+def fetch_sheets(urls, known=None):
+    known = known or {}
+    with ThreadPoolExecutor(max_workers=len(urls), thread_name_prefix="sheet-fetch") as pool:
+        futures = {name: pool.submit(fetch_sheet, url, known.get(name)) for name, url in urls.items()}
+        return {name: future.result() for name, future in futures.items()}
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from parsing import as_dates
+
+
+# --- 한글 요일 변환용 함수 ---
+def get_ko_date(dt):
+    if pd.isna(dt): return ""
+    days_ko = ['월', '화', '수', '목', '금', '토', '일']
+    if hasattr(dt, 'weekday'):
+        return f"{dt.strftime('%Y-%m-%d')} ({days_ko[dt.weekday()]})"
+    return str(dt)
+
+
+# 일 번호 목록 → 한글 요일 날짜 (표에 보이는 행에만 사용)
+def ko_dates(days):
+    return [get_ko_date(d) for d in as_dates(days)]
+
+
+# --- 정수 금액/건수 일괄 포맷 ('{:,.0f}' / '{:+,.0f}' 와 같은 결과) ---
+def format_numbers(values, suffix='', sign=False):
+    v = np.asarray(values, dtype='float64').round().astype('int64')
+    if not len(v):
+        return v.astype(str)
+    a = np.abs(v)
+    n_groups = max(1, (len(str(int(a.max()))) + 2) // 3)
+    # 세 자리씩 0을 채워 이어 붙인 뒤 앞쪽의 0과 쉼표를 지움
+    out = np.char.zfill((a % 1000).astype(str), 3)
+    for i in range(1, n_groups):
+        out = np.char.add(np.char.add(np.char.zfill((a // 1000 ** i % 1000).astype(str), 3), ','), out)
+    out = np.char.lstrip(out, '0,')
+    out = np.where(out == '', '0', out)
+    out = np.char.add(np.where(v < 0, '-', '+' if sign else ''), out)
+    return np.char.add(out, suffix) if suffix else out
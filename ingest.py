@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+
+from loader import clean_auction, enrich_auction
+
+
+# --- 경매일자(일 단위) 파티션 키 - 날짜가 잘못된 행은 -1 ---
+def _day_keys(dates):
+    days = dates.to_numpy(dtype='datetime64[ns]').astype('datetime64[D]').astype('int64')
+    return pd.Series(np.where(dates.notna().to_numpy(), days, -1), index=dates.index)
+
+
+# --- 파티션별 행 수 + 내용 해시 (파티션 안의 행 순서까지 반영) ---
+# 위치를 행 내용과 함께 해시한 뒤 더함 (따로 더하면 합이 순서와 무관해져 행을 바꿔도 같은 해시)
+def partition_manifest(raw, days):
+    valid = days >= 0
+    rows = raw[valid]
+    order = rows.groupby(days[valid]).cumcount().to_numpy()
+    h = pd.util.hash_pandas_object(rows.assign(_pos=order), index=False).to_numpy()
+    stats = pd.DataFrame({'day': days[valid].to_numpy(), 'h': h}).groupby('day')['h'].agg(['size', 'sum'])
+    return {str(d): [int(n), f"{int(hs):016x}"] for d, n, hs in zip(stats.index, stats['size'], stats['sum'])}
+
+
+# --- 증분 반영: 바뀐(새로 생긴/수정/삭제된) 파티션만 다시 정제하고 나머지는 이전 결과 재사용 ---
+def ingest_auction(raw, prev_df=None, prev_manifest=None):
+    dates = pd.to_datetime(raw['경매일자'], errors='coerce')
+    days = _day_keys(dates)
+    manifest = partition_manifest(raw, days)
+    if prev_df is None or not prev_manifest:
+        return enrich_auction(clean_auction(raw, dates)), manifest, {'changed': len(manifest), 'removed': 0}
+
+    kept_days = [int(d) for d, v in manifest.items() if prev_manifest.get(d) == v]
+    removed = [d for d in prev_manifest if d not in manifest]
+    reuse = days.isin(kept_days)
+    fresh = clean_auction(raw[~reuse & (days >= 0)], dates[~reuse & (days >= 0)])
+
+    # 재사용할 이전 행에 새 원본 행 번호를 붙임 (파티션 내용이 같으므로 파티션 안 순서도 같음)
+    prev_days = prev_df['경매일자'].astype('int64')
+    kept = prev_df[prev_days.isin(kept_days).to_numpy()]
+    kept_order = np.argsort(prev_days[prev_days.isin(kept_days)].to_numpy(), kind='stable')
+    raw_pos = np.flatnonzero(reuse.to_numpy())
+    raw_order = np.argsort(days.to_numpy()[raw_pos], kind='stable')
+    kept = kept.iloc[kept_order].set_axis(raw.index[raw_pos[raw_order]])
+
+    df_a = pd.concat([kept, fresh]) if len(fresh) else kept
+    df_a = enrich_auction(df_a.sort_index(kind='stable'))
+    return df_a, manifest, {'changed': len(manifest) - len(kept_days), 'removed': len(removed)}
@@ -0,0 +1,181 @@
+# 경매내역서 일괄 생성 (화면 없이 실행, 인터넷 연결 불필요)
+#   python invoices.py --date 2025-05-20 --out 내역서/
+#   python invoices.py --start 2025-05-01 --end 2025-05-31 --auction 경매.csv --members 회원.csv --format pdf
+import argparse
+import hashlib
+import html
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from config import SNAPSHOT_DIR
+from formatting import format_numbers, get_ko_date
+from loader import read_auction, read_members
+from parsing import as_dates
+from settlement import member_table, settle
+from snapshot import load_snapshot
+from views import date_bounds, NicknameIndex
+
+_CSS = """
+body { font-family: sans-serif; color: black; margin: 24px; }
+table { width: 100%; border-collapse: collapse; margin-bottom: 16px; }
+th { background-color: #f0f2f6; text-align: center; padding: 4px; }
+td { text-align: center; border-bottom: 1px solid #ddd; padding: 4px; }
+.info td { text-align: left; border: none; }
+.exempt { background-color: #d4edda; padding: 8px; border-radius: 5px; }
+.cols { display: flex; gap: 24px; } .cols > div { flex: 1; }
+.metric { font-size: 1.6em; font-weight: bold; } .caption { color: gray; font-size: 0.85em; }
+@page { size: A4; margin: 12mm; }
+"""
+
+_UNSAFE_CHARS = re.compile(r'[\\/:*?"<>|\s]+')  # 파일 이름에 쓸 수 없는 문자
+
+# 작업 프로세스마다 한 번만 받는 공유 데이터 (기간 데이터, 회원, 닉네임 인덱스, 정산표)
+_shared = {}
+
+
+# --- 데이터 읽기: CSV 파일을 주면 그 파일에서, 아니면 로컬 스냅샷에서 ---
+def load_sources(auction=None, members=None, snapshot_dir=SNAPSHOT_DIR):
+    if auction:
+        return read_auction(auction), read_members(members)
+    snap = load_snapshot(snapshot_dir)
+    if snap is None:
+        raise SystemExit(f"스냅샷이 없습니다: {snapshot_dir} (--auction/--members 로 CSV 파일을 지정하세요)")
+    return snap[0], snap[1]
+
+
+# --- 기간 안의 참여자 (화면의 고객 선택 목록과 같은 순서) ---
+def participants(period):
+    return sorted([p for p in pd.concat([period['판매자'], period['구매자']]).dropna().unique() if str(p).strip() != ""])
+
+
+def _table(rows, cols, daily):
+    disp = rows[cols].reset_index(drop=True)
+    disp.index += 1
+    disp['가격'] = format_numbers(disp['가격'])
+    if not daily: disp['경매일자'] = as_dates(disp['경매일자'])
+    return disp.to_html(border=0)
+
+
+# --- 한 고객의 경매내역서 HTML (화면의 경매내역서 조회와 같은 정산 계산/구성) ---
+def invoice_html(nick, title, total, info, sell_rows, buy_rows, daily):
+    esc = lambda v: html.escape(str(v))
+    s_total, s_fee, s_net = int(total['판매합계']), int(total['판매수수료']), int(total['판매정산'])
+    b_total_raw, b_fee, b_total_final = int(total['구매합계']), int(total['구매수수료']), int(total['구매청구'])
+    final_balance = int(total['정산금액'])
+    is_exempt = bool(total['면제'])
+    label = "💵 입금해드릴 돈" if final_balance > 0 else "📩 입금받을 돈"
+    f_txt = "면제" if is_exempt else f"{b_fee:,.0f}원"
+    s_cols, b_cols = (['품목', '가격', '구매자'], ['품목', '가격', '판매자']) if daily else (['경매일자', '품목', '가격'], ['경매일자', '품목', '가격'])
+    sell_html = _table(sell_rows, s_cols, daily) if len(sell_rows) else "<p>판매 내역 없음</p>"
+    buy_html = _table(buy_rows, b_cols, daily) if len(buy_rows) else "<p>구매 내역 없음</p>"
+    field = lambda k: esc(info[k]) if info is not None else '미등록'
+    return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>경매내역서 - {esc(nick)}</title><style>{_CSS}</style></head><body>
+<h1>📜 경매내역서</h1>
+<h3>{esc(title)}</h3>
+<h2>👤 {esc(nick)} 님의 상세 정보</h2>
+<table class="info"><tr><td><b>🏷️ 성함</b><br>{field('이름')}</td><td><b>📞 연락처</b><br>{field('전화번호')}</td><td><b>🏠 주소</b><br>{field('주소')}</td></tr></table>
+{'<p class="exempt">✨ 수수료 면제 대상 회원입니다</p>' if is_exempt else ''}
+<hr>
+<div class="cols">
+<div>📤 판매 정산금<div class="metric">{s_net:,.0f}원</div><div class="caption">판매합계 {s_total:,.0f}원 - 수수료 {s_fee:,.0f}원</div></div>
+<div>📥 구매 청구금<div class="metric">{b_total_final:,.0f}원</div><div class="caption">낙찰합계 {b_total_raw:,.0f}원 + 수수료 {f_txt}</div></div>
+<div>{label}<div class="metric">{abs(final_balance):,.0f}원</div><div class="caption">판매 정산금 - 구매 청구금</div></div>
+</div>
+<hr>
+<div class="cols">
+<div><h3>[판매 내역]</h3>{sell_html}</div>
+<div><h3>[구매 내역]</h3>{buy_html}</div>
+</div>
+</body></html>
+"""
+
+
+# 바꾼 문자가 있거나 대문자가 있으면 원래 닉네임의 짧은 해시를 붙임
+# → "a b", "a_b", "a/b" 나 (대소문자를 구분하지 않는 파일 시스템의) "Ab", "ab" 가 서로의 파일을 덮어쓰지 않음
+def _file_name(prefix, nick, fmt):
+    nick = str(nick)
+    name = _UNSAFE_CHARS.sub('_', nick)
+    if name != nick or name != name.lower():
+        name = f"{name}_{hashlib.md5(nick.encode('utf-8')).hexdigest()[:8]}"
+    return f"{prefix}_{name}.{fmt}"
+
+
+# PDF 는 weasyprint 가 설치되어 있을 때만 지원
+def _write(doc, path, fmt):
+    if fmt == 'pdf':
+        from weasyprint import HTML
+        HTML(string=doc).write_pdf(path)
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(doc)
+
+
+def _init_worker(period, df_members, title, daily, out_dir, prefix, fmt):
+    members = member_table(df_members)
+    _shared.update(period=period, members=members, index=NicknameIndex(period), totals=settle(period, members),
+                   title=title, daily=daily, out_dir=out_dir, prefix=prefix, fmt=fmt)
+
+
+# --- 작업 단위: 고객 한 명의 내역서를 만들어 바로 파일로 저장 ---
+def _render_one(nick):
+    s = _shared
+    period, index = s['period'], s['index']
+    total = s['totals'].loc[nick]
+    info = s['members'].loc[nick] if nick in s['members'].index else None
+    doc = invoice_html(nick, s['title'], total, info, period.iloc[index.rows('판매자', nick)], period.iloc[index.rows('구매자', nick)], s['daily'])
+    path = os.path.join(s['out_dir'], _file_name(s['prefix'], nick, s['fmt']))
+    _write(doc, path, s['fmt'])
+    return path
+
+
+# --- 기간 안의 모든 참여자 내역서 생성 (데이터는 작업 프로세스마다 한 번만 전달) ---
+def generate(df, df_members, start, end, out_dir, fmt='html', workers=None):
+    daily = end is None or pd.Timestamp(start) == pd.Timestamp(end)
+    lo, hi = date_bounds(df, start, end)
+    period = df.iloc[lo:hi].reset_index(drop=True)
+    nicks = participants(period)
+    title = f"📅 경매일자: {get_ko_date(pd.Timestamp(start).date())}" if daily else f"🗓️ 기간: {get_ko_date(pd.Timestamp(start).date())} ~ {get_ko_date(pd.Timestamp(end).date())}"
+    prefix = pd.Timestamp(start).strftime('%Y%m%d') + ('' if daily else pd.Timestamp(end).strftime('-%Y%m%d'))
+    os.makedirs(out_dir, exist_ok=True)
+    if not nicks:
+        return []
+    workers = min(workers or os.cpu_count() or 1, len(nicks))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(period, df_members, title, daily, out_dir, prefix, fmt)) as pool:
+        return list(pool.map(_render_one, nicks, chunksize=max(1, len(nicks) // (workers * 4))))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="경매내역서 일괄 생성")
+    parser.add_argument('--date', help="경매일자 (YYYY-MM-DD)")
+    parser.add_argument('--start', help="기간 시작일 (YYYY-MM-DD)")
+    parser.add_argument('--end', help="기간 종료일 (YYYY-MM-DD)")
+    parser.add_argument('--auction', help="경매 시트 CSV (없으면 로컬 스냅샷 사용)")
+    parser.add_argument('--members', help="회원 시트 CSV")
+    parser.add_argument('--snapshot', default=SNAPSHOT_DIR, help="스냅샷 폴더")
+    parser.add_argument('--out', default='invoices', help="저장 폴더")
+    parser.add_argument('--format', choices=['html', 'pdf'], default='html')
+    parser.add_argument('--workers', type=int, help="작업 프로세스 수 (기본: CPU 수)")
+    args = parser.parse_args(argv)
+    if not (args.date or args.start) or (args.auction and not args.members):
+        parser.error("--date 또는 --start/--end 를, CSV를 쓸 때는 --auction 과 --members 를 함께 지정하세요")
+    if args.format == 'pdf':
+        try:
+            import weasyprint  # noqa: F401
+        except ImportError:
+            parser.error("PDF 출력에는 weasyprint 패키지가 필요합니다 (pip install weasyprint)")
+
+    t0 = time.perf_counter()
+    df, df_members = load_sources(args.auction, args.members, args.snapshot)
+    start, end = (args.date, None) if args.date else (args.start, args.end or args.start)
+    paths = generate(df, df_members, start, end, args.out, args.format, args.workers)
+    print(f"내역서 {len(paths)}건 생성 → {args.out} ({time.perf_counter() - t0:.1f}s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+import io
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from fetch import fetch_sheet
+from loader import read_auction_raw, clean_auction
+from rollup import RollupCube
+
+logger = logging.getLogger(__name__)
+
+
+# 새벽 2시 경매 종료 전까지는 전날 경매로 봄 (오후 2시 ~ 새벽 2시)
+def live_auction_date(now=None):
+    return ((now or datetime.now()) - timedelta(hours=3)).date()
+
+
+# --- 실시간 경매 집계 (프로세스 전체 공유, 여러 세션이 불러도 간격마다 한 번만 받음) ---
+# 시트에서 오늘 경매가 시작되는 행 위치를 기억해 두고 그 뒤(오늘 행)만 다시 읽음,
+# 앞부분이 그대로면 새로 추가된 행만 집계해 더하고, 중간에 수정된 행이 있으면 오늘 행 전체로 다시 집계
+class LiveFeed:
+    def __init__(self, url):
+        self.url = url
+        self.revision = 0         # 집계가 바뀔 때마다 증가 (차트 캐시 키)
+        self._lock = threading.Lock()
+        self._reset(None)
+
+    def _reset(self, day):
+        self.day = day
+        self.cube = None          # 오늘 행만 담은 RollupCube
+        self.polled_at = 0.0
+        self.error = None
+        self._known = None        # 다음 조건부 요청에 쓸 ETag/해시
+        self._offset = 0          # 시트에서 오늘 첫 행의 위치
+        self._hashes = np.empty(0, dtype=np.uint64)
+
+    def view(self):
+        return self.cube.day(self.day) if self.cube is not None else None
+
+    def poll(self, day, interval):
+        with self._lock:
+            if day != self.day:
+                self._reset(day)
+            elif time.time() - self.polled_at < interval:
+                return False
+            self.polled_at = time.time()
+            try:
+                body, self._known = fetch_sheet(self.url, self._known)
+                if body is None:
+                    return False
+                self._update(self._tail(body))
+            except Exception as e:
+                logger.warning("실시간 경매 데이터 확인 실패: %s", e)
+                self.error = str(e)
+                return False
+            self.error = None
+            return True
+
+    # 오늘 경매 행 (원본 형식), 기억해 둔 위치가 어긋나면 처음부터 다시 찾음
+    # 위치 바로 앞 행은 오늘이 아니고 위치의 행은 오늘이어야 함 (위쪽 행이 삭제/삽입돼 밀리면 둘 중 하나가 깨짐)
+    def _tail(self, body):
+        if self._offset:
+            raw = read_auction_raw(io.BytesIO(body), skiprows=range(1, self._offset))
+            today = (pd.to_datetime(raw['경매일자'], errors='coerce').dt.date == self.day).to_numpy()
+            if len(raw) > 1 and not today[0] and today[1]:
+                return raw.iloc[1:][today[1:]]
+            self._offset = 0
+        raw = read_auction_raw(io.BytesIO(body))
+        today = (pd.to_datetime(raw['경매일자'], errors='coerce').dt.date == self.day).to_numpy()
+        if not today.any():
+            return raw.iloc[0:0]
+        self._offset = int(np.argmax(today))
+        return raw[today]
+
+    def _update(self, tail):
+        hashes = pd.util.hash_pandas_object(tail.astype(str), index=False).to_numpy()
+        seen = len(self._hashes)
+        if self.cube is not None and len(hashes) >= seen and np.array_equal(hashes[:seen], self._hashes):
+            if len(hashes) == seen:
+                return
+            self.cube = self.cube.merge(_build(tail.iloc[seen:], seen))
+        else:
+            self.cube = _build(tail, 0) if len(tail) else None
+        self._hashes = hashes
+        self.revision += 1
+
+
+# 오늘 행 일부를 정제해 집계 (행 번호는 오늘 첫 행 기준)
+def _build(rows, start):
+    rows = rows.set_axis(pd.RangeIndex(start, start + len(rows)))
+    return RollupCube.build(clean_auction(rows))
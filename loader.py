@@ -0,0 +1,71 @@
+import pandas as pd
+
+from config import URL_AUCTION, URL_MEMBERS
+from events import row_hashes, fingerprint
+from parsing import clean_prices, parse_auction_hours, day_ordinals, ordinal_dates
+
+AUCTION_COLS = ['경매일자', '판매자', '품목', '가격', '구매자', '낙찰시간']
+MEMBER_COLS = ['닉네임', '이름', '전화번호', '주소', '수수료면제여부', '전미수', '금액', '마지막혜택일', '계좌번호']
+
+
+# --- 경매 시트 읽기 (정제 전 원본) ---
+def read_auction_raw(source=URL_AUCTION, **read_kwargs):
+    raw = pd.read_csv(source, **read_kwargs)
+    raw.columns = AUCTION_COLS
+    return raw
+
+
+# --- 경매 행 정제 (원본 행 번호를 인덱스로 유지, 낙찰시간은 정렬용 시각으로 미리 변환) ---
+# 경매일자는 날짜 객체 대신 일 번호(int32)로 보관 → 화면에 보여줄 때만 parsing.as_dates 로 변환
+def clean_auction(raw, dates=None):
+    dates = pd.to_datetime(raw['경매일자'], errors='coerce') if dates is None else dates
+    valid = dates.notna()
+    df_a = raw[valid].drop(columns='낙찰시간')
+    df_a['가격'] = clean_prices(df_a['가격'])
+    df_a['정렬시간'] = parse_auction_hours(raw.loc[valid, '낙찰시간'])
+    df_a['경매일자'] = day_ordinals(dates[valid])
+    return df_a
+
+
+# --- 화면에서 쓰는 연도/월/연월/요일을 미리 계산하고 날짜순 정렬 (같은 날 안에서는 시트 순서 유지) ---
+def enrich_auction(df_a):
+    dt = pd.DatetimeIndex(ordinal_dates(df_a['경매일자']))
+    year, month = dt.year.to_numpy(), dt.month.to_numpy()
+    codes, months = pd.factorize(year * 100 + month, sort=True)
+    labels = [f"{m // 100}-{m % 100:02d}" for m in months]
+    df_a = df_a.assign(연도=year.astype('int16'), 월=month.astype('int8'), 연월=pd.Categorical.from_codes(codes, labels), 요일=dt.weekday.to_numpy().astype('int8'))
+    return share_nicknames(df_a.sort_values('경매일자', kind='stable').reset_index(drop=True))
+
+
+# --- 판매자/구매자를 하나의 닉네임 사전(정렬된 categories)을 공유하는 categorical 로 변환 ---
+def share_nicknames(df_a):
+    nicks = sorted(pd.concat([df_a['판매자'], df_a['구매자']]).dropna().unique(), key=str)
+    return df_a.assign(판매자=pd.Categorical(df_a['판매자'], categories=nicks), 구매자=pd.Categorical(df_a['구매자'], categories=nicks))
+
+
+def read_auction(source=URL_AUCTION):
+    return enrich_auction(clean_auction(read_auction_raw(source)))
+
+
+# --- 회원 시트 읽기 (I열(9번째) 계좌번호 포함) ---
+def read_members(source=URL_MEMBERS):
+    df_m = pd.read_csv(source)
+    if len(df_m.columns) >= 9:
+        df_m = df_m.iloc[:, :9]; df_m.columns = MEMBER_COLS
+    else:
+        df_m.columns = MEMBER_COLS[:len(df_m.columns)]
+        if '계좌번호' not in df_m.columns: df_m['계좌번호'] = "정보없음"
+    df_m['마지막혜택일'] = pd.to_datetime(df_m['마지막혜택일'], errors='coerce').dt.date
+    return df_m
+
+
+# --- 데이터 버전 (파생 캐시의 키로 사용) ---
+def data_version(df_a, df_m):
+    members_hash = fingerprint(pd.util.hash_pandas_object(df_m.astype(str), index=False).to_numpy())
+    return f"{len(df_a)}-{fingerprint(row_hashes(df_a)):016x}-{members_hash:016x}"
+
+
+def read_sources():
+    df_a, df_m = read_auction(), read_members()
+    df_a.attrs['data_version'] = data_version(df_a, df_m)
+    return df_a, df_m
@@ -0,0 +1,68 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# datetime.strptime 이 "%p %I:%M:%S", "%p %I:%M", "%H:%M:%S", "%H:%M" 로 읽을 수 있는 값과 같은 패턴
+# (초 60/61 은 strptime 정규식은 통과하지만 datetime 생성에서 실패하므로 제외)
+_TIME_RE = (r'^(?:(?P<p>am|pm)\s+(?P<I>1[0-2]|0[1-9]|[1-9])|(?P<H>2[0-3]|[0-1]\d|\d))'
+            r':(?:[0-5]\d|\d)(?::(?:[0-5]\d|\d))?$')
+_NUM_RE = r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?'
+
+
+# [수정] 가격 데이터 정제 강화 (마이너스 기호 안전하게 처리)
+def clean_price(val):
+    try:
+        # 쉼표 제거 및 공백 제거
+        s = str(val).replace(',', '').strip()
+        if not s or s == 'nan': return 0
+        # 실수형으로 변환 후 정수형으로 변환 (마이너스 유지)
+        return int(float(s))
+    except:
+        return 0
+
+
+# --- 가격 컬럼 일괄 정제 (clean_price 와 같은 결과, 같은 값은 한 번만 해석) ---
+def clean_prices(values):
+    if pd.api.types.is_integer_dtype(values.dtype) and not values.hasnans:
+        return values.astype('int64')
+    if pd.api.types.is_float_dtype(values.dtype):
+        nums = values.to_numpy(dtype='float64')
+    else:
+        codes, uniques = pd.factorize(values.fillna('').astype(str).str.replace(',', '', regex=False).str.strip())
+        text = pd.Series(uniques)
+        plain = text.str.fullmatch(_NUM_RE).to_numpy(dtype=bool)
+        parsed = np.zeros(len(text))
+        parsed[plain] = text[plain].astype('float64').to_numpy()
+        # 단순 숫자가 아닌 드문 값(예: '1_000', 전각 숫자, 'inf')만 기존 함수로 처리
+        odd = ~plain & (text != '').to_numpy() & (text != 'nan').to_numpy()
+        parsed[odd] = [clean_price(v) for v in text[odd]]
+        nums = np.where(codes >= 0, parsed[codes], 0) if len(parsed) else np.zeros(len(codes))
+    nums = np.where(np.isfinite(nums), np.trunc(nums), 0)
+    return pd.Series(nums.astype('int64'), index=values.index)
+
+
+# --- 낙찰시간 → 정렬용 시각 (오후 2시=14 ~ 새벽 2시=26, 해석 불가는 NA) ---
+def parse_auction_hours(values):
+    codes, uniques = pd.factorize(values.fillna('').astype(str).str.strip())
+    text = pd.Series(uniques).str.replace('오후', 'PM', regex=False).str.replace('오전', 'AM', regex=False)
+    parts = text.str.extract(_TIME_RE, flags=re.IGNORECASE)
+    pm = (parts['p'].str.lower() == 'pm').to_numpy(dtype=bool)
+    hour_12 = pd.to_numeric(parts['I'], errors='coerce') % 12 + np.where(pm, 12, 0)
+    hour = pd.to_numeric(parts['H'], errors='coerce').fillna(hour_12)
+    hour = hour.where(hour >= 14, hour + 24).astype('Int8')
+    return pd.Series(hour.array.take(codes, allow_fill=True), index=values.index)
+
+
+# --- 날짜 ↔ 일 번호 (1970-01-01 = 0, int32) ---
+def day_ordinals(dates):
+    return dates.to_numpy(dtype='datetime64[ns]').astype('datetime64[D]').astype('int32')
+
+
+def ordinal_dates(days):
+    return np.asarray(days, dtype='int64').astype('datetime64[D]')
+
+
+# 화면 표시용 datetime.date 목록 (보여줄 행에만 사용)
+def as_dates(days):
+    return ordinal_dates(days).astype(object)
@@ -0,0 +1,30 @@
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+# --- 일별 입금/정산 완료 표시 (로컬 SQLite, 로그아웃/다른 기기에서도 유지) ---
+# kind: 'in' = 입금 받을 돈(구매자), 'out' = 정산 드릴 돈(판매자)
+
+
+def _connect(path):
+    if os.path.dirname(path): os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, timeout=5)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS settled (day TEXT NOT NULL, kind TEXT NOT NULL, nick TEXT NOT NULL, "
+                 "done INTEGER NOT NULL, updated_at REAL NOT NULL, PRIMARY KEY (day, kind, nick))")
+    return conn
+
+
+# 해당 경매일의 완료 표시 {(kind, 닉네임): True/False}
+def load_settled(path, day):
+    with closing(_connect(path)) as conn:
+        rows = conn.execute("SELECT kind, nick, done FROM settled WHERE day = ?", (str(day),)).fetchall()
+    return {(kind, nick): bool(done) for kind, nick, done in rows}
+
+
+def mark_settled(path, day, kind, nick, done):
+    with closing(_connect(path)) as conn, conn:
+        conn.execute("INSERT INTO settled (day, kind, nick, done, updated_at) VALUES (?, ?, ?, ?, ?) "
+                     "ON CONFLICT (day, kind, nick) DO UPDATE SET done = excluded.done, updated_at = excluded.updated_at",
+                     (str(day), kind, str(nick), int(bool(done)), time.time()))
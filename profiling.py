@@ -0,0 +1,107 @@
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# 최근 측정 결과 (프로세스 전체, 관리자 패널에서 표시)
+recent_runs = deque(maxlen=50)
+cache_stats = {}
+
+_local = threading.local()  # 세션마다 스크립트가 별도 스레드에서 실행되므로 스레드별로 기록
+_lock = threading.Lock()
+
+
+class _Run:
+    def __init__(self, fields):
+        self.fields = fields
+        self.spans = []
+        self.stack = []
+        self.section = None
+        self.t0 = time.perf_counter()
+
+
+def _current():
+    return getattr(_local, 'run', None)
+
+
+# --- 한 번의 화면 실행 측정 시작 (시작하지 않으면 기록하지 않음) ---
+def start_run(**fields):
+    _local.run = _Run(fields)
+
+
+# 시간은 항상 재서 rec['ms'] 에 남기고, 측정 중인 실행이 있을 때만 기록에 추가
+@contextmanager
+def span(name, **fields):
+    run = _current()
+    rec = {'name': name, **fields}
+    if run is not None:
+        run.stack.append(rec)
+    t0 = time.perf_counter()
+    try:
+        yield rec
+    finally:
+        rec['ms'] = round((time.perf_counter() - t0) * 1000, 2)
+        if run is not None:
+            run.stack.pop()
+            run.spans.append(rec)
+
+
+# 들여쓰기 없이 이어지는 화면 구간 (다음 section 또는 finish_run 에서 닫힘)
+def section(name, **fields):
+    run = _current()
+    if run is None:
+        return
+    _close_section(run)
+    run.section = ({'name': name, **fields}, time.perf_counter())
+
+
+def _close_section(run):
+    if run.section:
+        rec, t0 = run.section
+        rec['ms'] = round((time.perf_counter() - t0) * 1000, 2)
+        run.spans.append(rec)
+        run.section = None
+
+
+# --- 캐시 함수 본문에서 호출 → 감싸고 있는 span 을 miss 로 표시 (본문이 실행되지 않으면 hit) ---
+def cache_miss(name):
+    with _lock:
+        stats = cache_stats.setdefault(name, {'hit': 0, 'miss': 0})
+        stats['miss'] += 1
+        stats['hit'] -= 1
+    run = _current()
+    if run is not None and run.stack:
+        run.stack[-1]['cache'] = 'miss'
+
+
+# 캐시 함수 호출 자리에서 사용 (일단 hit 로 세고, 본문이 실행되면 cache_miss 가 바로잡음)
+@contextmanager
+def cached_span(name, **fields):
+    with _lock:
+        cache_stats.setdefault(name, {'hit': 0, 'miss': 0})['hit'] += 1
+    with span(name, cache='hit', **fields) as rec:
+        yield rec
+
+
+def note(**fields):
+    run = _current()
+    if run is not None:
+        run.fields.update(fields)
+
+
+# --- 측정 종료: 기록을 남기고 구조화 로그(JSON Lines)에 한 줄 추가 ---
+def finish_run(log_path=None):
+    run = _current()
+    if run is None:
+        return None
+    _close_section(run)
+    _local.run = None
+    record = {'ts': time.strftime('%Y-%m-%dT%H:%M:%S'), **run.fields,
+              'total_ms': round((time.perf_counter() - run.t0) * 1000, 2), 'spans': run.spans}
+    recent_runs.append(record)
+    if log_path:
+        line = json.dumps(record, ensure_ascii=False, default=str)
+        with _lock, open(log_path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')
+    return record
@@ -0,0 +1,109 @@
+import pandas as pd
+
+from parsing import ordinal_dates
+from settlement import settle_totals
+
+TOP_LOTS_PER_DAY = 50  # 일별로 보관하는 최고가 낙찰품 수 (기간 TOP N 은 이 중에서 고름)
+LOT_COLS = ['경매일자', '품목', '가격', '구매자', '판매자']
+
+
+# --- 일 × 고객 × 역할 집계 (데이터 버전마다 한 번 생성, 월/연 단위는 일 단위에서 파생) ---
+class RollupCube:
+    def __init__(self, days, customers, hours, lots):
+        self.days = days            # 일자 → 매출, 건수, 참여자, 연월, 연도, 월
+        self.customers = customers  # (일자, 고객명) → 판매합계, 판매건수, 구매합계, 구매건수
+        self.hours = hours          # (일자, 정렬시간) → 매출금액, 낙찰건수
+        self.lots = lots            # 일자별 최고가 낙찰품 (원본 행 번호 인덱스)
+
+    @classmethod
+    def build(cls, df):
+        day = pd.Series(ordinal_dates(df['경매일자']), index=df.index, name='일자')
+        days = df.groupby(day)['가격'].agg(매출='sum', 건수='count')
+        sell = df.groupby([day, df['판매자'].rename('고객명')], observed=True)['가격'].agg(판매합계='sum', 판매건수='count')
+        buy = df.groupby([day, df['구매자'].rename('고객명')], observed=True)['가격'].agg(구매합계='sum', 구매건수='count')
+        customers = pd.concat([sell, buy], axis=1).fillna(0).astype('int64').sort_index()
+        hours = df.groupby([day, '정렬시간'])['가격'].agg(매출금액='sum', 낙찰건수='count')
+        lots = df[LOT_COLS].assign(일자=day)
+        return cls(_calendar(days, customers), customers, hours, _top_lots(lots))
+
+    # --- 새로 들어온 행만 집계한 큐브를 더함 (실시간 경매 모드, 행 번호는 기존 행 다음부터) ---
+    def merge(self, other):
+        customers = self.customers.add(other.customers, fill_value=0).astype('int64')
+        hours = self.hours.add(other.hours, fill_value=0).astype('int64')
+        days = self.days[['매출', '건수']].add(other.days[['매출', '건수']], fill_value=0).astype('int64')
+        return RollupCube(_calendar(days, customers), customers, hours, _top_lots(pd.concat([self.lots, other.lots])))
+
+    def months(self):
+        return sorted(self.days['연월'].unique(), reverse=True)
+
+    def years(self):
+        return sorted(self.days['연도'].unique(), reverse=True)
+
+    def day(self, date):
+        ts = pd.Timestamp(date)
+        return self.view(ts, ts)
+
+    def month(self, ym):
+        start = pd.Timestamp(f"{ym}-01")
+        return self.view(start, start + pd.offsets.MonthEnd(0))
+
+    def year(self, year):
+        return self.view(pd.Timestamp(int(year), 1, 1), pd.Timestamp(int(year), 12, 31))
+
+    def view(self, start, end):
+        return RollupView(self, start, end)
+
+
+# 일자별 참여자 수와 연월/연도/월
+def _calendar(days, customers):
+    days['참여자'] = customers.groupby(level='일자').size().reindex(days.index, fill_value=0)
+    days['연월'] = days.index.strftime('%Y-%m')
+    days['연도'] = days.index.year
+    days['월'] = days.index.month
+    return days
+
+
+# 일자별 최고가 낙찰품 TOP_LOTS_PER_DAY 개 (같은 가격이면 먼저 들어온 행 우선, 행 번호순으로 보관)
+def _top_lots(lots):
+    return lots.sort_values('가격', ascending=False, kind='stable').groupby('일자', sort=False).head(TOP_LOTS_PER_DAY).sort_index()
+
+
+# --- 기간 집계 (시작일 ~ 종료일, 일 단위 집계만 합산) ---
+class RollupView:
+    def __init__(self, cube, start, end):
+        self.daily = cube.days.loc[start:end]
+        self.customers = cube.customers.loc[start:end].groupby(level='고객명', observed=True).sum()
+        self._hours = cube.hours.loc[start:end]
+        self._lots = cube.lots[(cube.lots['일자'] >= start) & (cube.lots['일자'] <= end)]
+
+    @property
+    def empty(self):
+        return self.daily.empty
+
+    @property
+    def total_sales(self):
+        return int(self.daily['매출'].sum())
+
+    @property
+    def count(self):
+        return int(self.daily['건수'].sum())
+
+    @property
+    def n_days(self):
+        return len(self.daily)
+
+    # 수수료는 기간 합계 기준으로 계산 (기존 화면과 같은 int(기간합계 * RATE))
+    def settled(self, members):
+        return settle_totals(self.customers, members)
+
+    def buyers(self):
+        return self.customers.loc[self.customers['구매건수'] > 0, '구매합계'].sort_values(ascending=False, kind='stable')
+
+    def sellers(self):
+        return self.customers.loc[self.customers['판매건수'] > 0, '판매합계'].sort_values(ascending=False, kind='stable')
+
+    def hourly(self):
+        return self._hours.groupby(level='정렬시간').sum()
+
+    def top_lots(self, n):
+        return self._lots.sort_values('가격', ascending=False, kind='stable').head(n)[LOT_COLS]
@@ -0,0 +1,119 @@
+import copy
+
+import numpy as np
+import pandas as pd
+
+_CHUNK = 100000  # n-gram 을 만들 때 한 번에 처리하는 품목 수 (가장 긴 품목 길이 × 이 수만큼 메모리 사용)
+_EMPTY = (np.empty(0, dtype=np.int64), np.zeros(1, dtype=np.int64), np.empty(0, dtype=np.int32))
+
+
+# 검색용 정규화 (공백 제거 + 소문자) → "청자화병" 으로 "청자 화병" 도 찾음
+def normalize(text):
+    return text.astype(str).str.replace(r'\s+', '', regex=True).str.lower()
+
+
+# --- 품목 문자열 → (글자 n-gram 키, 품목 번호) 쌍, n 은 1(한 글자 검색용) 또는 2 (한글은 형태소 분석 없이 글자 단위로 충분히 찾힘) ---
+# 문자열을 UTF-32 코드 배열로 바꿔 두 글자를 정수 하나(앞 글자 << 21 | 뒤 글자)로 묶음
+def _gram_pairs(norm, first_id, n):
+    keys, ids = [], []
+    for start in range(0, len(norm), _CHUNK):
+        chunk = norm[start:start + _CHUNK]
+        width = max(int(chunk.str.len().max()), 2)
+        codes = np.asarray(chunk.to_numpy(dtype=str), dtype=f'U{width}').view(np.uint32).reshape(len(chunk), width).astype(np.int64)
+        grams = codes if n == 1 else (codes[:, :-1] << 21) | codes[:, 1:]
+        valid = codes[:, n - 1:] != 0
+        keys.append(grams[valid])
+        ids.append(np.broadcast_to(np.arange(first_id + start, first_id + start + len(chunk), dtype=np.int32)[:, None], valid.shape)[valid])
+    return np.concatenate(keys), np.concatenate(ids)
+
+
+def _query_keys(q, n):
+    codes = np.array([ord(c) for c in q], dtype=np.int64)
+    return np.unique(codes if n == 1 else (codes[:-1] << 21) | codes[1:])
+
+
+# 기존 목록 (정렬된 키, 키별 품목 번호 구간, 품목 번호) 에 새 (키, 품목 번호) 쌍을 합친 새 목록
+# 키 순위와 품목 번호를 정수 하나로 묶어 정렬, 중복 제거 → 키마다 품목 번호가 오름차순
+def _merge(postings, keys, ids, n_items):
+    old_keys, bounds, old_ids = postings
+    keys, ids = np.concatenate([np.repeat(old_keys, np.diff(bounds)), keys]), np.concatenate([old_ids, ids])
+    uniq = np.sort(pd.unique(keys))
+    pairs = np.sort(uniq.searchsorted(keys) * n_items + ids)
+    pairs = pairs[np.diff(pairs, prepend=-1) != 0]
+    rank = pairs // n_items
+    starts = np.flatnonzero(np.diff(rank, prepend=-1))
+    return uniq[rank[starts]], np.append(starts, len(rank)), (pairs % n_items).astype(np.int32)
+
+
+# --- 품목 역색인 (글자/2-gram → 품목 번호 → 행 번호, 날짜순 정렬된 경매 데이터 기준) ---
+# 새 데이터 버전에서는 처음 보는 품목 문자열만 n-gram 을 만들어 기존 색인에 합침 (refresh)
+class ItemIndex:
+    def __init__(self, df, version=None):
+        self.version = version
+        self.items = pd.Index([], dtype=object)
+        self._norm = pd.Series([], dtype=object)
+        self._postings = {1: _EMPTY, 2: _EMPTY}  # n → (정렬된 키, 키별 품목 번호 구간, 품목 번호)
+        self._update(df)
+
+    # 새 데이터 버전용 색인 (기존 색인은 다른 세션이 쓰고 있을 수 있으므로 고치지 않고 새로 만듦)
+    def refresh(self, df, version=None):
+        index = copy.copy(self)
+        index.version = version
+        return index._update(df)
+
+    def _update(self, df):
+        codes, uniques = pd.factorize(df['품목'].fillna('').astype(str))  # 빈 품목은 '' (factorize 의 -1 이 마지막 품목으로 가지 않도록)
+        known = self.items.get_indexer(uniques) if len(self.items) else np.full(len(uniques), -1)
+        new = uniques[known < 0]
+        if len(new):
+            known[known < 0] = np.arange(len(self.items), len(self.items) + len(new))
+            norm = normalize(pd.Series(new))
+            first = len(self.items)
+            self.items = self.items.append(pd.Index(new, dtype=object))
+            self._norm = pd.concat([self._norm, norm], ignore_index=True)
+            self._postings = {n: _merge(self._postings[n], *_gram_pairs(norm, first, n), len(self.items)) for n in (1, 2)}
+        # 행별 품목 번호와 품목 번호별 행 번호 (안정 정렬이라 품목 안에서는 날짜순)
+        self._codes = known[codes].astype(np.int32)
+        self._order = np.argsort(self._codes, kind='stable').astype(np.int32)
+        self._offsets = np.concatenate([[0], np.cumsum(np.bincount(self._codes, minlength=len(self.items)))])
+        return self
+
+    def _posting(self, n, key):
+        keys, bounds, ids = self._postings[n]
+        i = keys.searchsorted(key)
+        if i == len(keys) or keys[i] != key:
+            return np.empty(0, dtype=np.int32)
+        return ids[bounds[i]:bounds[i + 1]]
+
+    # 검색어를 포함하는 품목 번호 (한 글자는 글자 목록 그대로, 두 글자 이상은 2-gram 목록 교집합 → 세 글자 이상이면 후보만 실제 문자열 확인)
+    def match_items(self, query):
+        q = normalize(pd.Series([query])).iloc[0]
+        if len(q) < 2:
+            return self._posting(1, ord(q)) if q else np.empty(0, dtype=np.int32)
+        postings = sorted((self._posting(2, k) for k in _query_keys(q, 2)), key=len)
+        cand = postings[0]
+        for p in postings[1:]:
+            if not len(cand): break
+            cand = np.intersect1d(cand, p, assume_unique=True)
+        if len(q) > 2 and len(cand):
+            cand = cand[self._norm.iloc[cand].str.contains(q, regex=False).to_numpy(dtype=bool)]
+        return cand
+
+    # 검색어가 들어간 품목의 행 번호 (날짜순, lo ~ hi 행 범위로 제한 가능)
+    # 찾은 품목마다 품목별 행 구간을 한 번에 모아 정렬 → 찾은 행 수에 비례 (전체 행은 보지 않음)
+    def rows(self, query, lo=0, hi=None):
+        items = self.match_items(query)
+        starts, lens = self._offsets[items], np.diff(self._offsets)[items]
+        gather = np.repeat(starts - (np.cumsum(lens) - lens), lens) + np.arange(lens.sum())
+        pos = np.sort(self._order[gather])
+        if lo or hi is not None:
+            pos = pos[pos.searchsorted(lo):pos.searchsorted(hi) if hi is not None else len(pos)]
+        return pos
+
+
+# --- 가격 통계 (전체 + 연도별) ---
+def price_stats(lots):
+    prices = lots['가격']
+    overall = {'건수': len(prices), '평균': prices.mean(), '중앙값': prices.median(), '최저': prices.min(), '최고': prices.max()}
+    yearly = lots.groupby('연도')['가격'].agg(건수='count', 평균='mean', 중앙값='median', 최저='min', 최고='max').sort_index(ascending=False)
+    return overall, yearly
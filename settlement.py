@@ -0,0 +1,52 @@
+import pandas as pd
+
+from config import SELL_FEE_RATE, DEFAULT_BUY_FEE_RATE
+
+# 정산표 컬럼 (고객별 판매/구매 합계, 수수료, 최종 정산금액)
+SETTLE_COLS = ['판매합계', '판매수수료', '판매정산', '구매합계', '구매수수료', '구매청구', '정산금액']
+
+
+# --- 닉네임 인덱스 회원 테이블 ---
+def member_table(df_members):
+    # 닉네임이 중복되면 기존 조회(iloc[0])와 같이 첫 번째 행을 사용
+    members = df_members.dropna(subset=['닉네임']).drop_duplicates('닉네임').set_index('닉네임')
+    members['면제'] = members['수수료면제여부'].astype(str).str.strip() == '면제'
+    return members
+
+
+def is_exempt(members, nick):
+    return bool(nick in members.index and members.at[nick, '면제'])
+
+
+# --- 고객별 정산 계산 (판매/구매 각각 groupby 1회) ---
+# 닉네임 컬럼은 범주형이므로 observed=True 로 실제 거래가 있는 조합만 (pandas 2.x 기본값은 모든 닉네임 조합)
+def settle(frame, members, by=None):
+    keys = list(by or [])
+    sell = frame.groupby(keys + ['판매자'], observed=True)['가격'].sum().rename_axis(keys + ['고객명'])
+    buy = frame.groupby(keys + ['구매자'], observed=True)['가격'].sum().rename_axis(keys + ['고객명'])
+    totals = pd.concat({'판매합계': sell, '구매합계': buy}, axis=1).fillna(0).astype('int64')
+    return settle_totals(totals, members)
+
+
+# --- 이미 합산된 판매합계/구매합계(고객명 인덱스)에 수수료와 정산금액을 붙임 ---
+def settle_totals(totals, members):
+    out = totals[['판매합계', '구매합계']].copy()
+    names = out.index.get_level_values('고객명')
+    out['면제'] = members['면제'].reindex(names, fill_value=False).to_numpy(dtype=bool)
+
+    # 기존 int(x * RATE) 와 동일하게 0 방향으로 버림
+    out['판매수수료'] = (out['판매합계'] * SELL_FEE_RATE).astype('int64')
+    out['판매정산'] = out['판매합계'] - out['판매수수료']
+    out['구매수수료'] = (out['구매합계'] * DEFAULT_BUY_FEE_RATE).astype('int64').where(~out['면제'], 0)
+    out['구매청구'] = out['구매합계'] + out['구매수수료']
+    out['정산금액'] = out['판매정산'] - out['구매청구']
+    return out[SETTLE_COLS + ['면제']]
+
+
+# --- 한 고객의 정산 (거래가 없으면 0) ---
+def settle_one(frame, members, nick):
+    rows = frame[(frame['판매자'] == nick) | (frame['구매자'] == nick)]
+    table = settle(rows, members)
+    if nick in table.index:
+        return table.loc[nick]
+    return pd.Series({**{c: 0 for c in SETTLE_COLS}, '면제': is_exempt(members, nick)})
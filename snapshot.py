@@ -0,0 +1,134 @@
+import io
+import json
+import logging
+import os
+import threading
+import time
+
+import pandas as pd
+import pyarrow as pa
+
+from config import URL_AUCTION, URL_MEMBERS
+from fetch import fetch_sheets
+from ingest import ingest_auction
+from loader import read_auction_raw, read_members, data_version, share_nicknames
+from profiling import span
+
+logger = logging.getLogger(__name__)
+
+# 저장하는 컬럼 구성이 바뀌면 올림 → 이전 형식의 스냅샷은 버리고 원본에서 다시 만듦
+SNAPSHOT_SCHEMA = 4
+
+_refresh_lock = threading.Lock()
+
+
+def _paths(directory):
+    return {name: os.path.join(directory, f"{name}.arrow") for name in ('auction', 'members')}, os.path.join(directory, 'meta.json')
+
+
+# --- Arrow로 저장할 수 없는 혼합형(숫자+문자) 컬럼은 문자열로 통일 ---
+def _arrow_safe(df):
+    df = df.copy()
+    for c in df.columns:
+        if df[c].dtype == object and pd.api.types.infer_dtype(df[c], skipna=True) in ('mixed', 'mixed-integer', 'mixed-integer-float'):
+            df[c] = df[c].where(df[c].isna(), df[c].astype(str))
+    return df
+
+
+# 임시 파일에 쓴 뒤 교체 → 읽는 쪽은 항상 완전한 파일만 봄
+def _write_arrow(df, path):
+    table = pa.Table.from_pandas(_arrow_safe(df), preserve_index=False)
+    tmp = f"{path}.tmp"
+    with pa.OSFile(tmp, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp, path)
+
+
+# to_pandas 가 어차피 전체를 복사하므로 메모리 맵 없이 파일을 그대로 읽음
+def _read_arrow(path):
+    with pa.OSFile(path, 'rb') as source:
+        return pa.ipc.open_file(source).read_all().to_pandas(date_as_object=True)
+
+
+# --- 스냅샷 저장 (정제 완료된 경매/회원 데이터) ---
+def save_snapshot(df_a, df_m, directory, partitions=None, sources=None):
+    os.makedirs(directory, exist_ok=True)
+    files, meta_path = _paths(directory)
+    _write_arrow(df_a, files['auction'])
+    _write_arrow(df_m, files['members'])
+    meta = {'schema': SNAPSHOT_SCHEMA, 'saved_at': time.time(), 'data_version': df_a.attrs.get('data_version'), 'rows': len(df_a),
+            'partitions': partitions or {}, 'sources': sources or {}}
+    return _write_meta(meta_path, meta)
+
+
+def _write_meta(meta_path, meta):
+    with open(f"{meta_path}.tmp", 'w') as f:
+        json.dump(meta, f)
+    os.replace(f"{meta_path}.tmp", meta_path)
+    return meta
+
+
+# --- 스냅샷 정보만 읽기 (데이터 파일은 열지 않음, 없거나 형식이 다르면 None) ---
+def load_meta(directory):
+    try:
+        with open(_paths(directory)[1]) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get('schema') == SNAPSHOT_SCHEMA else None
+
+
+# --- 스냅샷 읽기 (없거나 손상되면 None) ---
+def load_snapshot(directory):
+    files = _paths(directory)[0]
+    meta = load_meta(directory)
+    if meta is None:
+        return None
+    try:
+        df_a, df_m = _read_arrow(files['auction']), _read_arrow(files['members'])
+    except (OSError, ValueError, pa.ArrowException):
+        return None
+    # Arrow는 빈 날짜를 None으로 돌려주므로 원본(read_members)과 같이 NaT로 맞춤
+    df_m['마지막혜택일'] = pd.to_datetime(df_m['마지막혜택일'], errors='coerce').dt.date
+    # 컬럼마다 따로 저장된 닉네임 사전을 다시 하나로 공유
+    df_a = share_nicknames(df_a)
+    df_a.attrs['data_version'] = meta.get('data_version')
+    return df_a, df_m, meta
+
+
+def snapshot_age(meta):
+    return time.time() - meta.get('saved_at', 0)
+
+
+# --- 원본(구글 시트)에서 새로 받아 스냅샷 갱신 (두 시트를 동시에 받고, 바뀐 시트/경매일자 파티션만 다시 정제) ---
+def _refresh(directory):
+    prev = load_snapshot(directory)
+    prev_df, prev_m, prev_meta = prev if prev else (None, None, {})
+    with span('sheet_download') as t_download:
+        fetched = fetch_sheets({'auction': URL_AUCTION, 'members': URL_MEMBERS}, prev_meta.get('sources'))
+    (auction_body, _), (members_body, _) = fetched['auction'], fetched['members']
+    sources = {name: validators for name, (_, validators) in fetched.items()}
+    if auction_body is None and members_body is None:
+        # 두 시트 모두 그대로 → 정제/저장 없이 확인 시각만 갱신
+        _write_meta(_paths(directory)[1], {**prev_meta, 'saved_at': time.time(), 'sources': sources})
+        logger.info("스냅샷 확인: 변경 없음 (다운로드 %.0fms)", t_download['ms'])
+        return prev_df, prev_m
+    df_m = read_members(io.BytesIO(members_body)) if members_body is not None else prev_m
+    with span('ingest') as t_ingest:
+        if auction_body is not None:
+            raw = read_auction_raw(io.BytesIO(auction_body))
+            df_a, manifest, stats = ingest_auction(raw, prev_df, prev_meta.get('partitions'))
+        else:
+            df_a, manifest, stats = prev_df, prev_meta.get('partitions'), {'changed': 0, 'removed': 0}
+        t_ingest['rows'] = len(df_a)
+        df_a.attrs['data_version'] = data_version(df_a, df_m)
+    save_snapshot(df_a, df_m, directory, partitions=manifest, sources=sources)
+    logger.info("스냅샷 갱신: %d행, 파티션 %d개 재정제, %d개 삭제 (다운로드 %.0fms, 정제 %.0fms)", len(df_a), stats['changed'], stats['removed'],
+                t_download['ms'], t_ingest['ms'])
+    return df_a, df_m
+
+
+def refresh_snapshot(directory):
+    with _refresh_lock:
+        return _refresh(directory)
+
@@ -0,0 +1,124 @@
+import glob
+import os
+import sqlite3
+from contextlib import closing
+from urllib.request import pathname2url
+
+import numpy as np
+import pandas as pd
+
+from settlement import SETTLE_COLS, settle_totals, is_exempt
+
+# --- 경매/회원 시트를 로컬 SQLite 에 옮겨 두고 기간/회원/요약 집계를 SQL 로 계산 (BACKEND=sqlite) ---
+# 경매일자는 일 번호(1970-01-01 기준 정수)로 저장, 수수료 계산은 pandas 경로와 같은 settle_totals 사용
+# 데이터 버전마다 파일을 따로 만듦 → 이전 묶음을 쓰는 화면 실행은 끝날 때까지 자기 버전의 파일만 봄
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE auction (day INTEGER NOT NULL, seller TEXT, item TEXT, price INTEGER NOT NULL, buyer TEXT);
+CREATE TABLE members (nick TEXT PRIMARY KEY, name TEXT, phone TEXT, address TEXT, exempt INTEGER NOT NULL, account TEXT);
+"""
+_INDEXES = """
+CREATE INDEX auction_day ON auction (day);
+CREATE INDEX auction_buyer ON auction (buyer, day);
+CREATE INDEX auction_seller ON auction (seller, day);
+"""
+
+
+def _day(date):
+    return int(np.datetime64(pd.Timestamp(date), 'D').astype('int64'))
+
+
+def _nullable(values):
+    values = values.astype(object)
+    return values.where(values.notna(), None).tolist()
+
+
+# 데이터 버전별 DB 파일 경로 (예: auction.sqlite.<버전>)
+def version_path(base, version):
+    return f"{base}.{version}" if version else base
+
+
+# keep 에 없는 다른 버전의 DB 파일 삭제
+def prune(base, keep):
+    for path in glob.glob(glob.escape(base) + '.*'):
+        if path not in keep and not path.endswith('.tmp'):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+class SqliteStore:
+    def __init__(self, path):
+        self.path = path
+
+    # 읽기 전용 (파일이 지워졌으면 빈 DB 를 새로 만들지 않고 오류)
+    def _connect(self):
+        return sqlite3.connect(f"file:{pathname2url(os.path.abspath(self.path))}?mode=ro", uri=True, timeout=5)
+
+    @property
+    def version(self):
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute("SELECT value FROM meta WHERE key = 'data_version'").fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    # --- 정제된 경매/회원 데이터를 옮겨 씀 (같은 데이터 버전이면 생략, 임시 파일에 만든 뒤 교체) ---
+    def mirror(self, df_a, df_m):
+        version = df_a.attrs.get('data_version')
+        if version is not None and self.version == version:
+            return False
+        if os.path.dirname(self.path): os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        if os.path.exists(tmp): os.remove(tmp)
+        members = df_m.dropna(subset=['닉네임']).drop_duplicates('닉네임')
+        exempt = members['수수료면제여부'].astype(str).str.strip() == '면제'
+        with closing(sqlite3.connect(tmp)) as conn, conn:
+            conn.executescript(_SCHEMA)
+            conn.execute("INSERT INTO meta VALUES ('data_version', ?)", (version,))
+            conn.executemany("INSERT INTO auction VALUES (?, ?, ?, ?, ?)",
+                             zip(df_a['경매일자'].astype('int64').tolist(), _nullable(df_a['판매자']), _nullable(df_a['품목']),
+                                 df_a['가격'].astype('int64').tolist(), _nullable(df_a['구매자'])))
+            conn.executemany("INSERT INTO members VALUES (?, ?, ?, ?, ?, ?)",
+                             zip(members['닉네임'].astype(str).tolist(), _nullable(members['이름']), _nullable(members['전화번호']),
+                                 _nullable(members['주소']), exempt.astype(int).tolist(), _nullable(members['계좌번호'])))
+            conn.executescript(_INDEXES)
+        os.replace(tmp, self.path)
+        return True
+
+    def _query(self, sql, params):
+        with closing(self._connect()) as conn:
+            return conn.execute(sql, params).fetchall()
+
+    # --- 고객별 판매합계/구매합계 (기간·회원 조건은 인덱스로 거름, by_day 이면 일자별) ---
+    def totals(self, start=None, end=None, nick=None, by_day=False):
+        cond, params = [], []
+        if start is not None: cond.append("day >= ?"); params.append(_day(start))
+        if end is not None: cond.append("day <= ?"); params.append(_day(end))
+        where = "".join(f" AND {c}" for c in cond)
+        sell_where, buy_where = "seller IS NOT NULL" + where, "buyer IS NOT NULL" + where
+        if nick is not None:
+            sell_where, buy_where = f"seller = ?{where}", f"buyer = ?{where}"
+            params = [str(nick)] + params
+        keys = "day, nick" if by_day else "nick"
+        rows = self._query(f"SELECT {keys}, SUM(sell), SUM(buy) FROM ("
+                           f"SELECT day, seller AS nick, price AS sell, 0 AS buy FROM auction WHERE {sell_where} UNION ALL "
+                           f"SELECT day, buyer, 0, price FROM auction WHERE {buy_where}) GROUP BY {keys} ORDER BY {keys}",
+                           params + params)
+        names = ['경매일자', '고객명'] if by_day else ['고객명']
+        totals = pd.DataFrame(rows, columns=names + ['판매합계', '구매합계'])
+        return totals.set_index(names).astype('int64')
+
+    # settlement.settle(frame, members, by=['경매일자' 또는 없음]) 과 같은 정산표
+    def settle(self, members, start=None, end=None, nick=None, by_day=False):
+        return settle_totals(self.totals(start, end, nick, by_day), members)
+
+    # settlement.settle_one 과 같음 (거래가 없으면 0)
+    def settle_one(self, members, nick, start=None, end=None):
+        table = self.settle(members, start, end, nick)
+        if nick in table.index:
+            return table.loc[nick]
+        return pd.Series({**{c: 0 for c in SETTLE_COLS}, '면제': is_exempt(members, nick)})
@@ -0,0 +1,24 @@
+import streamlit as st
+
+from formatting import format_numbers
+from profiling import span
+
+PAGE_SIZE = 50  # 화면에 한 번에 보내는 행 수 (내역서 표는 full=True 로 전체)
+
+
+# --- 페이지 단위 표 (보이는 페이지만 포맷해서 전송) ---
+# formats: {컬럼: 단위 문자열(숫자 포맷) 또는 함수(값 목록 → 표시 문자열 목록)}, signed: + 부호를 붙일 컬럼
+def paged_table(df, key, formats=None, signed=(), full=False, page_size=PAGE_SIZE):
+    n_pages = max(1, -(-len(df) // page_size))
+    page = 1
+    if n_pages > 1 and not full:
+        page = st.number_input(f"페이지 (총 {n_pages}쪽 / {len(df):,}건)", min_value=1, max_value=n_pages, value=1, key=f"page_{key}")
+    with span(f"table:{key}", rows=len(df)):
+        view = df if full else df.iloc[(page - 1) * page_size:page * page_size]
+        view = view.copy()
+        for col, fmt in (formats or {}).items():
+            view[col] = fmt(view[col]) if callable(fmt) else format_numbers(view[col], fmt, col in signed)
+        st.table(view)
+    # 페이지 선택은 인쇄할 때 숨기므로 잘린 표임을 알 수 있게 범위를 함께 표시
+    if n_pages > 1 and not full:
+        st.caption(f"{len(df):,}건 중 {(page - 1) * page_size + 1:,}–{min(page * page_size, len(df)):,}")
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+from parsing import as_dates
+
+
+def _ordinal(date):
+    return np.datetime64(pd.Timestamp(date), 'D').astype('int64')
+
+
+# --- 날짜순 정렬된 경매 데이터에서 [시작일, 종료일] 구간의 행 범위 (일 번호 이진 탐색) ---
+def date_bounds(df, start, end=None):
+    days = df['경매일자'].to_numpy()
+    lo, hi = days.searchsorted(_ordinal(start), 'left'), days.searchsorted(_ordinal(end if end is not None else start), 'right')
+    return int(lo), int(max(lo, hi))
+
+
+# --- 경매일 → [시작, 끝) 행 범위 표 (날짜순 정렬된 데이터에서 데이터 버전마다 한 번 생성) ---
+class DateIndex:
+    def __init__(self, df):
+        days = df['경매일자'].to_numpy()
+        starts = np.flatnonzero(np.diff(days, prepend=days[:1] - 1))  # 날짜가 바뀌는 행 (첫 행 포함)
+        self.days = days[starts]
+        self.offsets = np.append(starts, len(days))
+        self.dates = list(as_dates(self.days[::-1]))  # 사이드바 날짜 목록 (최신순)
+
+    # 경매일 표(수천 개)에서만 이진 탐색 → 전체 행을 훑거나 마스크를 만들지 않음
+    def bounds(self, start, end=None):
+        i = self.days.searchsorted(_ordinal(start), 'left')
+        j = self.days.searchsorted(_ordinal(end if end is not None else start), 'right')
+        return int(self.offsets[i]), int(self.offsets[max(i, j)])
+
+
+# --- 닉네임 → 행 번호 인덱스 (판매자/구매자가 공유하는 닉네임 사전의 코드 기준, 날짜순 int32 배열) ---
+class NicknameIndex:
+    ROLES = ('구매자', '판매자')
+
+    def __init__(self, df):
+        names = df['구매자'].cat.categories
+        self._lookup = {name: i for i, name in enumerate(names)}
+        self._roles = {}
+        for role in self.ROLES:
+            codes = df[role].cat.codes.to_numpy()
+            # 같은 닉네임의 행 번호가 연속되도록 정렬 (안정 정렬이라 닉네임 안에서는 날짜순)
+            order = np.argsort(codes, kind='stable').astype(np.int32)
+            counts = np.bincount(codes[codes >= 0], minlength=len(names))
+            offsets = np.concatenate([[0], np.cumsum(counts)]) + int((codes < 0).sum())
+            self._roles[role] = (order, offsets)
+
+    # 해당 역할로 거래한 행 번호 (lo ~ hi 행 범위로 제한 가능)
+    def rows(self, role, nick, lo=0, hi=None):
+        code = self._lookup.get(nick)
+        if code is None:
+            return np.empty(0, dtype=np.int32)
+        order, offsets = self._roles[role]
+        pos = order[offsets[code]:offsets[code + 1]]
+        if lo or hi is not None:
+            pos = pos[pos.searchsorted(lo):pos.searchsorted(hi) if hi is not None else len(pos)]
+        return pos
+
+    # 구매자 또는 판매자로 거래한 모든 행 번호 (날짜순)
+    def member_rows(self, nick, lo=0, hi=None):
+        return np.union1d(self.rows('구매자', nick, lo, hi), self.rows('판매자', nick, lo, hi))
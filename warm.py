@@ -0,0 +1,116 @@
+import logging
+import threading
+import time
+
+from config import SNAPSHOT_MAX_AGE, WARM_INTERVAL, BACKEND, STORE_DB
+from events import EventLedger
+from rollup import RollupCube
+from search import ItemIndex
+from settlement import member_table, settle
+from snapshot import load_meta, load_snapshot, refresh_snapshot, snapshot_age
+from store import SqliteStore, prune, version_path
+from views import DateIndex, NicknameIndex
+from profiling import span
+
+logger = logging.getLogger(__name__)
+
+
+# --- 데이터 버전 하나에 대해 화면이 쓰는 것을 모두 미리 만든 묶음 (만든 뒤에는 고치지 않음) ---
+# 이전 묶음이 있으면 품목 색인과 배송비 이벤트 장부는 바뀐 부분만 반영
+class Prepared:
+    def __init__(self, df, df_members, previous=None):
+        version = df.attrs.get('data_version')
+        self.version = version
+        self.df, self.df_members = df, df_members
+        self.members = member_table(df_members)
+        self.cube = RollupCube.build(df)
+        self.nick_index = NicknameIndex(df)
+        self.date_index = DateIndex(df)
+        self.member_totals = settle(df, self.members)  # 회원 정보 조회의 전체 기간 정산
+        if previous is None:
+            self.item_index = ItemIndex(df, version)
+            self.ledger = EventLedger.build(df, self.members, version)
+        else:
+            self.item_index = previous.item_index.refresh(df, version)
+            self.ledger = previous.ledger.refresh(df, self.members, version)
+        self.standings = self.ledger.standings()
+        self.store = None
+        if BACKEND == 'sqlite':
+            # 이 버전 전용 파일에 옮기고, 지금/직전 묶음이 쓰는 파일 말고는 정리
+            self.store = SqliteStore(version_path(STORE_DB, version))
+            self.store.mirror(df, df_members)
+            prune(STORE_DB, {self.store.path} | ({previous.store.path} if previous is not None and previous.store else set()))
+        self.built_at = time.time()
+
+
+# --- 서버와 함께 시작하는 백그라운드 준비 작업 (프로세스 전체 공유) ---
+# 스냅샷이 만료되기 전에 시트를 새로 받고, 데이터 버전이 바뀌면 새 묶음을 다 만든 뒤 한 번에 바꿔 끼움
+# → 화면은 항상 완성된 묶음(self.state)만 보고, 새 묶음을 만드는 동안에도 이전 묶음으로 바로 응답
+class Warmer:
+    def __init__(self, directory, interval=WARM_INTERVAL):
+        self.directory = directory
+        self.interval = interval
+        self.state = None       # 지금 화면에 쓰는 Prepared (참조 교체로만 바뀜)
+        self.error = None
+        self.checked_at = 0.0
+        self._lock = threading.Lock()    # 준비 작업은 한 번에 하나씩
+        self._ready = threading.Event()  # 첫 준비 시도가 끝나면 설정 (성공/실패 모두)
+        self._wake = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="warmer", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while True:
+            try:
+                self.warm()
+            except Exception as e:
+                logger.exception("데이터 준비 실패")
+                self.error = str(e)
+            self._ready.set()
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    # 바로 다시 확인 (기다리지 않음)
+    def poke(self):
+        self._wake.set()
+
+    # 지금 묶음 (서버 기동 직후 첫 준비가 끝나기 전에만 기다림, 실패했으면 None)
+    def current(self, timeout=None):
+        if self.state is None:
+            if self._ready.is_set(): self.poke()
+            self._ready.wait(timeout)
+        return self.state
+
+    # 스냅샷 확인 → 필요하면 시트를 새로 받고, 데이터 버전이 바뀌었으면 새 묶음을 만들어 교체 (교체했으면 True)
+    def warm(self, refresh=False):
+        with self._lock:
+            self.checked_at = time.time()
+            meta = load_meta(self.directory)
+            fresh = None
+            # 다음 확인 전에 만료될 스냅샷이면 미리 새로 받음 (시트 오류 시 기존 스냅샷으로 계속)
+            if refresh or meta is None or snapshot_age(meta) + self.interval >= SNAPSHOT_MAX_AGE:
+                try:
+                    fresh = refresh_snapshot(self.directory)
+                except Exception as e:
+                    if refresh or meta is None: raise
+                    logger.warning("시트 갱신 실패 (기존 스냅샷 사용): %s", e)
+            if fresh is None:
+                if self.state is not None and meta.get('data_version') == self.state.version:
+                    self.error = None
+                    return False
+                snap = load_snapshot(self.directory)
+                if snap is None: raise RuntimeError(f"스냅샷을 읽을 수 없습니다: {self.directory}")
+                fresh = snap[:2]
+            df, df_members = fresh
+            if self.state is not None and df.attrs.get('data_version') == self.state.version:
+                self.error = None
+                return False
+            with span('warm') as rec:
+                state = Prepared(df, df_members, self.state)
+            self.state, self.error = state, None
+            logger.info("데이터 준비 완료: %d행, 버전 %s (%.0fms)", len(df), state.version, rec['ms'])
+            return True